@@ -14,6 +14,8 @@ from pathlib import Path
 @dataclass
 class Point:
     """2D Point in millimeters"""
+    __slots__ = ('x', 'y')
+
     x: float
     y: float
 
@@ -21,6 +23,8 @@ class Point:
 @dataclass
 class Rectangle:
     """Rectangle defined by x, y, width, height"""
+    __slots__ = ('x', 'y', 'width', 'height')
+
     x: float
     y: float
     width: float
@@ -27,6 +27,9 @@ class AppMode(Enum):
 @dataclass
 class DetectionResult:
     """Result of a logo detection"""
+    __slots__ = ('logo_id', 'success', 'position', 'angle', 'confidence',
+                 'error_mm', 'error_deg', 'timestamp')
+
     logo_id: str
     success: bool
     position: tuple[float, float]  # x, y in pixels
@@ -36,6 +39,19 @@ class DetectionResult:
     error_deg: float
     timestamp: float
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dict of the fields (all scalars or tuples, so unlike asdict() no deep copy is needed)"""
+        return {
+            'logo_id': self.logo_id,
+            'success': self.success,
+            'position': self.position,
+            'angle': self.angle,
+            'confidence': self.confidence,
+            'error_mm': self.error_mm,
+            'error_deg': self.error_deg,
+            'timestamp': self.timestamp
+        }
+
 
 @dataclass
 class HardwareStatus:
@@ -7,8 +7,11 @@ from __future__ import annotations
 
 import logging
 import json
+import operator
 import os
 import platform
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import asdict
@@ -25,6 +28,12 @@ except ImportError:
     tk = None
     print("Warning: OpenCV, PIL or tkinter not available. GUI tools disabled.")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..config.models import (
     Logo, Style, Variant, Point, Rectangle,
     create_default_config, AlignPressConfig
@@ -43,6 +52,19 @@ from .template_overlay_manager import TemplateOverlayManager
 
 logger = logging.getLogger(__name__)
 
+# Flat field extraction for logo serialization (one C-level call per logo)
+LOGO_FIELDS_GETTER = operator.attrgetter(
+    'id', 'name', 'position_mm.x', 'position_mm.y',
+    'roi.x', 'roi.y', 'roi.width', 'roi.height',
+    'tolerance_mm', 'detector_type'
+)
+
+# Accepts any partial numeric entry while typing ("", "-", "12.", "-3.5", "1e-")
+NUMERIC_ENTRY_PATTERN = re.compile(r'-?\d*\.?\d*(?:[eE][-+]?\d*)?')
+
+# How often the Tk thread checks whether a template decode has finished
+TEMPLATE_POLL_MS = 50
+
 
 class ConfigDesigner:
     """Interactive configuration designer for multi-logo garments"""
@@ -71,6 +93,7 @@ class ConfigDesigner:
         self.current_style: Optional[Style] = None
         self.calibration_data: Optional[Dict] = None
         self.mm_per_pixel: float = 1.0  # Default fallback
+        self._px_per_mm: float = 1.0  # Cached 1 / mm_per_pixel
 
         # Hierarchical configuration state
         self.current_design: str = ""  # e.g., "ComunicacionesFutbol"
@@ -88,6 +111,7 @@ class ConfigDesigner:
 
         # Logo selection state
         self.selected_logo_index: Optional[int] = None
+        self._active_logo: Optional[Logo] = None  # Resolved selected logo for hot paths
         self.editing_mode: str = "none"  # "template", "logo", "none"
 
         # Template interaction state
@@ -96,6 +120,9 @@ class ConfigDesigner:
         self.dragging_logo: bool = False
         self.updating_from_drag: bool = False
         self.drag_start_pos: Optional[tuple] = None
+        self._redraw_pending: bool = False
+        self._pending_drag: Optional[tuple] = None  # Latest (kind, canvas_x, canvas_y)
+        self._last_broadcast: Optional[tuple] = None  # Template state last pushed to the fields
 
         # Canvas and visualization
         self.image_canvas = None
@@ -114,6 +141,10 @@ class ConfigDesigner:
         # Template system (preserved for compatibility)
         self.template_positions: Dict[str, Dict] = {}
 
+        # Last text/colour pushed to each StringVar-bound label (see _set_label_text)
+        self._label_text_cache: Dict[str, str] = {}
+        self._label_color_cache: Dict[str, str] = {}
+
         # UI Components initialization (to avoid AttributeError)
         self.calib_status_label = None
         self.calib_factor_label = None
@@ -135,12 +166,20 @@ class ConfigDesigner:
         self.logo_templates = {}  # Template cache
         self.template_references = {}  # Template metadata cache
 
+        # Background decoding of template images keeps the mainloop responsive
+        self._template_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="template-loader")
+
         # Setup UI and register callbacks
         self._setup_ui()
         self._register_ui_callbacks()
 
         logger.info("ConfigDesigner initialized with new architecture")
 
+    def _set_calibration(self, mm_per_pixel: float):
+        """Set calibration factor and refresh the cached px/mm converter"""
+        self.mm_per_pixel = mm_per_pixel
+        self._px_per_mm = 1.0 / mm_per_pixel if mm_per_pixel > 0 else 0.0
+
     def _register_ui_callbacks(self):
         """Register callbacks for UI events with new architecture"""
         # Image operations
@@ -503,11 +542,13 @@ class ConfigDesigner:
         info_frame = ttk.Frame(parent)
         info_frame.pack(fill=tk.X, padx=5, pady=2)
 
-        self.template_info_label = ttk.Label(info_frame, text="📁 Sin template cargado", foreground="gray")
+        self.template_info_var = tk.StringVar(value="📁 Sin template cargado")
+        self.template_info_label = ttk.Label(info_frame, textvariable=self.template_info_var, foreground="gray")
         self.template_info_label.pack(side=tk.LEFT)
 
         # Template size info
-        self.template_size_label = ttk.Label(info_frame, text="", foreground="blue")
+        self.template_size_var = tk.StringVar()
+        self.template_size_label = ttk.Label(info_frame, textvariable=self.template_size_var, foreground="blue")
         self.template_size_label.pack(side=tk.RIGHT)
 
         # Load button
@@ -527,9 +568,14 @@ class ConfigDesigner:
         self.position_frame = ttk.LabelFrame(parent, text="📐 Posición y Tamaño")
 
         # Dynamic editing indicator
-        self.editing_indicator = ttk.Label(self.position_frame, text="", foreground="blue", font=("TkDefaultFont", 8))
+        self.editing_indicator_var = tk.StringVar()
+        self.editing_indicator = ttk.Label(self.position_frame, textvariable=self.editing_indicator_var,
+                                           foreground="blue", font=("TkDefaultFont", 8))
         self.editing_indicator.pack(fill=tk.X, padx=5, pady=(5, 0))
 
+        # Reject non-numeric keystrokes at the widget level
+        self._numeric_vcmd = (self.root.register(self._is_valid_number), '%P')
+
         # Position fields
         self._create_position_fields(self.position_frame)
 
@@ -548,25 +594,40 @@ class ConfigDesigner:
 
         # X position
         ttk.Label(pos_grid, text="X (mm):").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
-        self.pos_x_var = tk.DoubleVar()
-        self.pos_x_entry = ttk.Entry(pos_grid, textvariable=self.pos_x_var, width=8)
+        self.pos_x_var = tk.StringVar()
+        self.pos_x_entry = ttk.Entry(pos_grid, textvariable=self.pos_x_var, width=8,
+                                  validate='key', validatecommand=self._numeric_vcmd)
         self.pos_x_entry.grid(row=0, column=1, padx=(0, 10))
-        try:
-            self.pos_x_var.trace('w', self._on_position_changed)
-        except tk.TclError:
-            # macOS compatibility: use add instead of 'w'
-            self.pos_x_var.trace_add('write', self._on_position_changed)
+        self._bind_field_commit(self.pos_x_entry, self._on_position_changed)
 
         # Y position
         ttk.Label(pos_grid, text="Y (mm):").grid(row=0, column=2, sticky=tk.W, padx=(0, 5))
-        self.pos_y_var = tk.DoubleVar()
-        self.pos_y_entry = ttk.Entry(pos_grid, textvariable=self.pos_y_var, width=8)
+        self.pos_y_var = tk.StringVar()
+        self.pos_y_entry = ttk.Entry(pos_grid, textvariable=self.pos_y_var, width=8,
+                                  validate='key', validatecommand=self._numeric_vcmd)
         self.pos_y_entry.grid(row=0, column=3)
-        try:
-            self.pos_y_var.trace('w', self._on_position_changed)
-        except tk.TclError:
-            # macOS compatibility: use add instead of 'w'
-            self.pos_y_var.trace_add('write', self._on_position_changed)
+        self._bind_field_commit(self.pos_y_entry, self._on_position_changed)
+
+    @staticmethod
+    def _is_valid_number(value: str) -> bool:
+        """Validate numeric entry content on each keystroke"""
+        return NUMERIC_ENTRY_PATTERN.fullmatch(value) is not None
+
+    def _set_label_text(self, label, text_var, text, foreground=None):
+        """Update a StringVar-bound label, skipping values it already shows"""
+        var_name = str(text_var)
+        if self._label_text_cache.get(var_name) != text:
+            self._label_text_cache[var_name] = text
+            text_var.set(text)
+
+        if foreground is not None and self._label_color_cache.get(var_name) != foreground:
+            self._label_color_cache[var_name] = foreground
+            label.configure(foreground=foreground)
+
+    def _bind_field_commit(self, entry, callback):
+        """Fire callback only when the user commits the field (Enter or focus loss)"""
+        entry.bind('<Return>', lambda event: callback())
+        entry.bind('<FocusOut>', lambda event: callback())
 
     def _create_size_fields(self, parent):
         """Create width/height size input fields"""
@@ -575,25 +636,19 @@ class ConfigDesigner:
 
         # Width
         ttk.Label(size_grid, text="Ancho (mm):").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
-        self.width_var = tk.DoubleVar()
-        self.width_entry = ttk.Entry(size_grid, textvariable=self.width_var, width=8)
+        self.width_var = tk.StringVar()
+        self.width_entry = ttk.Entry(size_grid, textvariable=self.width_var, width=8,
+                                  validate='key', validatecommand=self._numeric_vcmd)
         self.width_entry.grid(row=0, column=1, padx=(0, 10))
-        try:
-            self.width_var.trace('w', self._on_size_changed)
-        except tk.TclError:
-            # macOS compatibility: use add instead of 'w'
-            self.width_var.trace_add('write', self._on_size_changed)
+        self._bind_field_commit(self.width_entry, self._on_size_changed)
 
         # Height
         ttk.Label(size_grid, text="Alto (mm):").grid(row=0, column=2, sticky=tk.W, padx=(0, 5))
-        self.height_var = tk.DoubleVar()
-        self.height_entry = ttk.Entry(size_grid, textvariable=self.height_var, width=8)
+        self.height_var = tk.StringVar()
+        self.height_entry = ttk.Entry(size_grid, textvariable=self.height_var, width=8,
+                                  validate='key', validatecommand=self._numeric_vcmd)
         self.height_entry.grid(row=0, column=3)
-        try:
-            self.height_var.trace('w', self._on_size_changed)
-        except tk.TclError:
-            # macOS compatibility: use add instead of 'w'
-            self.height_var.trace_add('write', self._on_size_changed)
+        self._bind_field_commit(self.height_entry, self._on_size_changed)
 
     def _create_template_action_buttons(self, parent):
         """Create template action buttons"""
@@ -613,7 +668,8 @@ class ConfigDesigner:
 
         Phase 3 Strangler Fig Pattern - Extracted method
         """
-        self.template_status_label = ttk.Label(parent, text="", foreground="green")
+        self.template_status_var = tk.StringVar()
+        self.template_status_label = ttk.Label(parent, textvariable=self.template_status_var, foreground="green")
         self.template_status_label.pack(fill=tk.X, padx=5, pady=2)
 
         return self.template_status_label
@@ -827,10 +883,11 @@ class ConfigDesigner:
 
             # Load logos using PresetManager (Phase 3 Migration)
             self.current_style.logos = self.preset_manager.create_logos_from_config(config_data)
+            self._clear_selection()
 
             # Load calibration if available
             if 'calibration_factor' in config_data:
-                self.mm_per_pixel = config_data['calibration_factor']
+                self._set_calibration(config_data['calibration_factor'])
 
             # Initialize config if needed
             from alignpress_v2.config.models import AlignPressConfig, LibraryData
@@ -859,26 +916,21 @@ class ConfigDesigner:
             "size": size,
             "part": part,
             "calibration_factor": self.mm_per_pixel,
-            "logos": []
+            # Convert logos to dict format
+            "logos": [
+                {
+                    "id": logo_id,
+                    "name": name,
+                    "position_mm": {"x": pos_x, "y": pos_y},
+                    "roi": {"x": roi_x, "y": roi_y, "width": roi_w, "height": roi_h},
+                    "tolerance_mm": tolerance,
+                    "detector": detector
+                }
+                for logo_id, name, pos_x, pos_y, roi_x, roi_y, roi_w, roi_h, tolerance, detector
+                in map(LOGO_FIELDS_GETTER, self.current_style.logos)
+            ]
         }
 
-        # Convert logos to dict format
-        for logo in self.current_style.logos:
-            logo_data = {
-                "id": logo.id,
-                "name": logo.name,
-                "position_mm": {"x": logo.position_mm.x, "y": logo.position_mm.y},
-                "roi": {
-                    "x": logo.roi.x,
-                    "y": logo.roi.y,
-                    "width": logo.roi.width,
-                    "height": logo.roi.height
-                },
-                "tolerance_mm": logo.tolerance_mm,
-                "detector": logo.detector_type
-            }
-            config_data["logos"].append(logo_data)
-
         return config_data
 
     def _update_ui_after_preset_save(self, design, size, part, config_path):
@@ -924,6 +976,7 @@ class ConfigDesigner:
 
             with open(config_path, 'w', encoding='utf-8') as f:
                 json.dump(config_data, f, indent=2, ensure_ascii=False)
+            self.preset_manager.invalidate_listing_cache()
 
             # Update UI after successful save
             self._update_ui_after_preset_save(design, size, part, config_path)
@@ -965,10 +1018,11 @@ class ConfigDesigner:
 
             # Load logos using PresetManager
             self.current_style.logos = self.preset_manager.create_logos_from_config(config_data)
+            self._clear_selection()
 
             # Load calibration
             if 'calibration_factor' in config_data:
-                self.mm_per_pixel = config_data['calibration_factor']
+                self._set_calibration(config_data['calibration_factor'])
 
             # Initialize config if needed
             from ..config.models import AlignPressConfig, LibraryData
@@ -1028,10 +1082,15 @@ class ConfigDesigner:
             return
 
         # Prepare image for display
-        photo_image = self.image_processor.prepare_image_for_canvas()
+        # Fast nearest-neighbour resize only while dragging; _on_canvas_release
+        # requests the full-quality (INTER_AREA) redraw once the drag ends
+        photo_image = self.image_processor.prepare_image_for_canvas(
+            fast_preview=self.dragging_logo or self.dragging_template
+        )
         if photo_image and self.image_canvas:
-            # Clear canvas
-            self.image_canvas.delete("all")
+            # Clear canvas, keeping rulers/grid so an unchanged layout is not
+            # recreated item by item (see RulerGridSystem.draw_rulers_and_grid)
+            self.image_canvas.delete("!ruler&&!grid")
 
             # Initialize ruler/grid system if not exists
             if not self.ruler_grid_system:
@@ -1087,29 +1146,26 @@ class ConfigDesigner:
         self.position_markers.clear()
         self.roi_rectangles.clear()
 
-        # Draw each logo using ImageProcessor
-        for logo in self.current_style.logos:
-            self._draw_single_logo_with_processor(logo)
-
-    def _draw_single_logo_with_processor(self, logo: Logo):
-        """Draw single logo using ImageProcessor"""
-        # Get position and ROI using ImageProcessor
-        pos_x, pos_y = self.image_processor.calculate_logo_canvas_position(logo, self.mm_per_pixel)
-        roi_x, roi_y, roi_w, roi_h = self.image_processor.calculate_logo_roi_canvas(logo, self.mm_per_pixel)
+        # Convert every logo's position and ROI in one batch, then draw each
+        logos = self.current_style.logos
+        positions = self.image_processor.calculate_logos_canvas_positions(logos, self.mm_per_pixel)
+        rois = self.image_processor.calculate_logos_roi_canvas(logos, self.mm_per_pixel)
 
         # Adjust for ruler offset
         offset_x, offset_y = self.ruler_grid_system.get_ruler_offset()
-        pos_x += offset_x
-        pos_y += offset_y
-        roi_x += offset_x
-        roi_y += offset_y
+        positions += (offset_x, offset_y)
+        rois[:, :2] += (offset_x, offset_y)
+
+        for logo, position, roi in zip(logos, positions.tolist(), rois.tolist()):
+            self._draw_single_logo_with_processor(logo, position, roi)
+
+    def _draw_single_logo_with_processor(self, logo: Logo, position: List[int], roi: List[int]):
+        """Draw single logo at its precomputed canvas position and ROI"""
+        pos_x, pos_y = position
+        roi_x, roi_y, roi_w, roi_h = roi
 
         # Determine if logo is selected
-        is_selected = (self.editing_mode == "logo" and
-                      self.selected_logo_index is not None and
-                      self.current_style and
-                      self.selected_logo_index < len(self.current_style.logos) and
-                      logo == self.current_style.logos[self.selected_logo_index])
+        is_selected = self.editing_mode == "logo" and logo is self._active_logo
 
         color = "orange" if is_selected else "blue"
         width = 3 if is_selected else 2
@@ -1206,6 +1262,31 @@ class ConfigDesigner:
             else:
                 self.ui_manager.show_error_message("Error", "No se pudo cargar la imagen")
 
+    def _request_redraw(self):
+        """Schedule a single _display_image on the next idle cycle"""
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.root.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        """Run the redraw scheduled by _request_redraw"""
+        self._redraw_pending = False
+        self._apply_pending_drag()
+        self._display_image()
+
+    def _apply_pending_drag(self):
+        """Apply the latest stashed drag position (earlier motion events are dropped)"""
+        if self._pending_drag is None:
+            return
+        kind, canvas_x, canvas_y = self._pending_drag
+        self._pending_drag = None
+
+        if kind == "logo":
+            self._move_logo_to_canvas_position(canvas_x, canvas_y)
+        else:
+            self._move_template_to_canvas_position(canvas_x, canvas_y)
+
     def _display_image(self):
         """Display current image on canvas (with template overlay if active)"""
         if self.current_image is None:
@@ -1234,29 +1315,34 @@ class ConfigDesigner:
         self.position_markers.clear()
         self.roi_rectangles.clear()
 
+        logos = self.current_style.logos
+        if not logos:
+            return
+
+        # Convert all logos mm -> canvas pixels in one batch:
+        # columns are pos_x, pos_y, roi_x, roi_y, roi_w, roi_h
+        coords_mm = np.fromiter(
+            (value for logo in logos for value in (
+                logo.position_mm.x, logo.position_mm.y,
+                logo.roi.x, logo.roi.y, logo.roi.width, logo.roi.height
+            )),
+            dtype=np.float64, count=6 * len(logos)
+        ).reshape(-1, 6)
+        # Fallback to 1 px/mm if no calibration
+        px_per_mm = self._px_per_mm if self.mm_per_pixel > 0 else 1.0
+        coords_px = coords_mm * (px_per_mm * self.canvas_scale)
+
         # Draw each logo
-        for logo in self.current_style.logos:
-            self._draw_single_logo(logo)
-
-    def _draw_single_logo(self, logo: Logo):
-        """Draw a single logo marker and ROI"""
-        # Convert mm to pixels using calibration data
-        if self.mm_per_pixel > 0:
-            x_px = (logo.position_mm.x / self.mm_per_pixel) * self.canvas_scale
-            y_px = (logo.position_mm.y / self.mm_per_pixel) * self.canvas_scale
-        else:
-            # Fallback if no calibration
-            x_px = logo.position_mm.x * self.canvas_scale
-            y_px = logo.position_mm.y * self.canvas_scale
+        for logo, coords in zip(logos, coords_px.tolist()):
+            self._draw_single_logo(logo, *coords)
 
+    def _draw_single_logo(self, logo: Logo, x_px: float, y_px: float,
+                          roi_x: float, roi_y: float, roi_w: float, roi_h: float):
+        """Draw a single logo marker and ROI from precomputed canvas coordinates"""
         # Draw position marker (crosshair)
         size = 10
         # Highlight selected logo
-        is_selected = (self.editing_mode == "logo" and
-                      self.selected_logo_index is not None and
-                      self.current_style and
-                      self.selected_logo_index < len(self.current_style.logos) and
-                      logo == self.current_style.logos[self.selected_logo_index])
+        is_selected = self.editing_mode == "logo" and logo is self._active_logo
 
         color = "orange" if is_selected else "blue"
         width = 3 if is_selected else 2
@@ -1271,19 +1357,7 @@ class ConfigDesigner:
             fill=color, width=width, tags=f"logo_{logo.id}"
         )
 
-        # ROI rectangle (convert mm to pixels)
-        if self.mm_per_pixel > 0:
-            roi_x = (logo.roi.x / self.mm_per_pixel) * self.canvas_scale
-            roi_y = (logo.roi.y / self.mm_per_pixel) * self.canvas_scale
-            roi_w = (logo.roi.width / self.mm_per_pixel) * self.canvas_scale
-            roi_h = (logo.roi.height / self.mm_per_pixel) * self.canvas_scale
-        else:
-            # Fallback if no calibration
-            roi_x = logo.roi.x * self.canvas_scale
-            roi_y = logo.roi.y * self.canvas_scale
-            roi_w = logo.roi.width * self.canvas_scale
-            roi_h = logo.roi.height * self.canvas_scale
-
+        # ROI rectangle
         rect = self.image_canvas.create_rectangle(
             roi_x, roi_y, roi_x + roi_w, roi_y + roi_h,
             outline=color, width=width, tags=f"logo_{logo.id}"
@@ -1306,10 +1380,13 @@ class ConfigDesigner:
         """Handle logo selection from list - Template-First workflow"""
         selection = self.logo_list.curselection()
         if not selection or not self.current_style:
-            self.selected_logo_index = None
+            self._clear_selection()
             self.editing_mode = "none"
             self.position_frame.pack_forget()
-            self.editing_indicator.config(text="💡 Selecciona un logo o carga un template", foreground="gray")
+            self._set_label_text(
+                self.editing_indicator, self.editing_indicator_var,
+                "💡 Selecciona un logo o carga un template", "gray"
+            )
             return
 
         # Set selected logo index and trigger our new selection handler
@@ -1323,30 +1400,31 @@ class ConfigDesigner:
 
     def _update_unified_position_panel(self):
         """Update unified position panel with current data"""
+        self._last_broadcast = None
         if self.editing_mode == "template" and self.selected_template_id:
             # Update panel for template positioning
             template_info = self.template_positions.get(self.selected_template_id)
             if template_info:
                 pos = template_info.get('position', (0, 0))
                 size = template_info.get('size', (50, 50))
-                self.pos_x_var.set(str(int(pos[0] * self.mm_per_pixel) if self.mm_per_pixel else pos[0]))
-                self.pos_y_var.set(str(int(pos[1] * self.mm_per_pixel) if self.mm_per_pixel else pos[1]))
+                self.pos_x_var.set(f"{pos[0] * self.mm_per_pixel if self.mm_per_pixel else pos[0]:.2f}")
+                self.pos_y_var.set(f"{pos[1] * self.mm_per_pixel if self.mm_per_pixel else pos[1]:.2f}")
                 # Para templates, usar las dimensiones reales calculadas si están disponibles
                 if hasattr(self, 'template_size_mm') and self.template_size_mm:
-                    self.width_var.set(str(round(self.template_size_mm[0], 1)))
-                    self.height_var.set(str(round(self.template_size_mm[1], 1)))
+                    self.width_var.set(f"{self.template_size_mm[0]:.1f}")
+                    self.height_var.set(f"{self.template_size_mm[1]:.1f}")
                 else:
                     # Fallback para datos antiguos o cuando no hay template_size_mm
-                    self.width_var.set(str(int(size[0] * self.mm_per_pixel) if self.mm_per_pixel else size[0]))
-                    self.height_var.set(str(int(size[1] * self.mm_per_pixel) if self.mm_per_pixel else size[1]))
+                    self.width_var.set(f"{size[0] * self.mm_per_pixel if self.mm_per_pixel else size[0]:.2f}")
+                    self.height_var.set(f"{size[1] * self.mm_per_pixel if self.mm_per_pixel else size[1]:.2f}")
         elif self.editing_mode == "logo" and self.selected_logo_index is not None and self.current_style:
             # Update panel for logo editing
             if self.selected_logo_index < len(self.current_style.logos):
                 selected_logo = self.current_style.logos[self.selected_logo_index]
-                self.pos_x_var.set(str(selected_logo.position_mm.x))
-                self.pos_y_var.set(str(selected_logo.position_mm.y))
-                self.width_var.set(str(selected_logo.roi.width))
-                self.height_var.set(str(selected_logo.roi.height))
+                self.pos_x_var.set(f"{selected_logo.position_mm.x:.2f}")
+                self.pos_y_var.set(f"{selected_logo.position_mm.y:.2f}")
+                self.width_var.set(f"{selected_logo.roi.width:.2f}")
+                self.height_var.set(f"{selected_logo.roi.height:.2f}")
         else:
             # Clear panel
             self.pos_x_var.set("")
@@ -1376,20 +1454,12 @@ class ConfigDesigner:
                     selected_logo.roi.width = float(self.width_var.get())
                     selected_logo.roi.height = float(self.height_var.get())
 
-            self._update_logo_list()
+            self._update_logo_list(self.selected_logo_index, action="update")
             self._draw_logos()
 
         except ValueError as e:
             messagebox.showerror("Error", f"Valores inválidos: {e}")
 
-    def _update_logo_list(self):
-        """Update the logo list display"""
-        self.logo_list.delete(0, tk.END)
-
-        if self.current_style:
-            for i, logo in enumerate(self.current_style.logos):
-                self.logo_list.insert(i, f"{logo.id} - {logo.name}")
-
     def _fit_image(self):
         """Fit image to canvas"""
         if self.current_image is not None:
@@ -1414,6 +1484,7 @@ class ConfigDesigner:
                 # Load first style if available
                 if self.current_config.library.styles:
                     self.current_style = self.current_config.library.styles[0]
+                    self._clear_selection()
                     # Style info now derived from hierarchical path
                     pass
                     self._update_logo_list()
@@ -1514,7 +1585,7 @@ class ConfigDesigner:
                     self.calibration_data = json.load(f)
 
                 # Extract mm/pixel factor
-                self.mm_per_pixel = self.calibration_data.get('factor_mm_px', 1.0)
+                self._set_calibration(self.calibration_data.get('factor_mm_px', 1.0))
 
                 # Update UI
                 self.calibration_label.config(
@@ -1572,10 +1643,10 @@ class ConfigDesigner:
         for logo in self.current_style.logos:
             if self.mm_per_pixel > 0:
                 # Convert mm to pixels
-                roi_x = int(logo.roi.x / self.mm_per_pixel * scale)
-                roi_y = int(logo.roi.y / self.mm_per_pixel * scale)
-                roi_w = int(logo.roi.width / self.mm_per_pixel * scale)
-                roi_h = int(logo.roi.height / self.mm_per_pixel * scale)
+                roi_x = int(logo.roi.x * self._px_per_mm * scale)
+                roi_y = int(logo.roi.y * self._px_per_mm * scale)
+                roi_w = int(logo.roi.width * self._px_per_mm * scale)
+                roi_h = int(logo.roi.height * self._px_per_mm * scale)
 
                 # Draw rectangle
                 cv2.rectangle(image_preview,
@@ -1623,13 +1694,13 @@ class ConfigDesigner:
                 for logo in self.current_style.logos:
                     if self.mm_per_pixel > 0:
                         # Convert mm to pixels
-                        roi_x = int(logo.roi.x / self.mm_per_pixel)
-                        roi_y = int(logo.roi.y / self.mm_per_pixel)
-                        roi_w = int(logo.roi.width / self.mm_per_pixel)
-                        roi_h = int(logo.roi.height / self.mm_per_pixel)
+                        roi_x = int(logo.roi.x * self._px_per_mm)
+                        roi_y = int(logo.roi.y * self._px_per_mm)
+                        roi_w = int(logo.roi.width * self._px_per_mm)
+                        roi_h = int(logo.roi.height * self._px_per_mm)
 
-                        pos_x = int(logo.position_mm.x / self.mm_per_pixel)
-                        pos_y = int(logo.position_mm.y / self.mm_per_pixel)
+                        pos_x = int(logo.position_mm.x * self._px_per_mm)
+                        pos_y = int(logo.position_mm.y * self._px_per_mm)
 
                         # Draw ROI
                         cv2.rectangle(debug_image,
@@ -1694,11 +1765,10 @@ class ConfigDesigner:
             self.current_config.active_style_id = self.current_style.id
 
             # Run simulation
-            simulator = DetectionSimulator()
-
-            result = simulator.simulate_garment_detection(
-                temp_image_path, self.current_style, self.current_config
-            )
+            with DetectionSimulator() as simulator:
+                result = simulator.simulate_garment_detection(
+                    temp_image_path, self.current_style, self.current_config
+                )
 
             # Show results in new window
             self._show_detection_results(result, temp_image_path)
@@ -1860,8 +1930,8 @@ class ConfigDesigner:
             """Show debug image with detection overlays"""
             try:
                 from ..tools.detection_simulator import DetectionSimulator
-                simulator = DetectionSimulator()
-                debug_path = simulator.create_visual_debug_image(image_path, result)
+                with DetectionSimulator() as simulator:
+                    debug_path = simulator.create_visual_debug_image(image_path, result)
 
                 if debug_path and debug_path.exists():
                     # Open debug image in new window
@@ -2231,6 +2301,7 @@ class ConfigDesigner:
                 config_data = json.load(f)
 
             # Clear current logos
+            self._clear_selection()
             if self.current_style:
                 self.current_style.logos.clear()
             else:
@@ -2282,57 +2353,93 @@ class ConfigDesigner:
         )
 
         if filename:
-            try:
-                # Try to load template with different modes
-                template_image = cv2.imread(filename, cv2.IMREAD_UNCHANGED)
-                if template_image is None:
-                    # Try with regular color mode
-                    template_image = cv2.imread(filename, cv2.IMREAD_COLOR)
-                    if template_image is None:
-                        raise ValueError("No se pudo cargar el template - formato no soportado")
-
-                # Validate template dimensions
-                if len(template_image.shape) < 2:
-                    raise ValueError("Template inválido - dimensiones incorrectas")
-
-                # Generate unique template ID
-                template_id = f"template_{len(self.logo_templates) + 1}"
-
-                # Store template
-                self.logo_templates[template_id] = template_image
-                self.template_references[template_id] = {
-                    'filename': Path(filename).name,
-                    'path': filename,
-                    'size': template_image.shape[:2],
-                    'channels': template_image.shape[2] if len(template_image.shape) == 3 else 1
-                }
+            self._set_label_text(
+                self.template_info_label, self.template_info_var,
+                f"⏳ Cargando {Path(filename).name}...", "gray"
+            )
 
-                self.selected_template_id = template_id
+            # Decode in a worker thread; the Tk thread polls the future, so
+            # the worker never touches Tk
+            future = self._template_executor.submit(self._read_template_image, filename)
+            self.root.after(TEMPLATE_POLL_MS, self._poll_template_future, filename, future)
 
-                # Update UI labels
-                template_name = Path(filename).name
-                channels_info = f"({template_image.shape[2]} canales)" if len(template_image.shape) == 3 else "(escala de grises)"
-                self.template_info_label.config(text=f"📄 {template_name} {channels_info}", foreground="green")
-                self.template_status_label.config(text="✅ Template cargado - Ahora arrastra en la imagen", foreground="green")
+    def _poll_template_future(self, filename: str, future: Future):
+        """Register the template once its decode finished (Tk thread)"""
+        if future.done():
+            self._register_template(filename, future)
+        else:
+            self.root.after(TEMPLATE_POLL_MS, self._poll_template_future, filename, future)
+
+    @staticmethod
+    def _read_template_image(filename: str) -> np.ndarray:
+        """Decode a template image from disk (runs in the template loader thread)"""
+        # Try to load template with different modes
+        template_image = cv2.imread(filename, cv2.IMREAD_UNCHANGED)
+        if template_image is None:
+            # Try with regular color mode
+            template_image = cv2.imread(filename, cv2.IMREAD_COLOR)
+            if template_image is None:
+                raise ValueError("No se pudo cargar el template - formato no soportado")
+
+        # Validate template dimensions
+        if len(template_image.shape) < 2:
+            raise ValueError("Template inválido - dimensiones incorrectas")
+
+        return template_image
+
+    def _register_template(self, filename: str, future: Future):
+        """Register a decoded template and show it on the image (Tk thread)"""
+        try:
+            template_image = future.result()
+
+            # Generate unique template ID
+            template_id = f"template_{len(self.logo_templates) + 1}"
+
+            # Store template (drop any resized copies cached under this id)
+            self.logo_templates[template_id] = template_image
+            self.template_overlay_manager.invalidate_template_cache(template_id)
+            self.template_references[template_id] = {
+                'filename': Path(filename).name,
+                'path': filename,
+                'size': template_image.shape[:2],
+                'channels': template_image.shape[2] if len(template_image.shape) == 3 else 1
+            }
 
-                # Switch to template editing mode
-                self.editing_mode = "template"
-                self.selected_logo_index = None
+            self.selected_template_id = template_id
 
-                # Show template immediately in center of image
-                self._show_template_on_image()
+            # Update UI labels
+            template_name = Path(filename).name
+            channels_info = f"({template_image.shape[2]} canales)" if len(template_image.shape) == 3 else "(escala de grises)"
+            self._set_label_text(
+                self.template_info_label, self.template_info_var,
+                f"📄 {template_name} {channels_info}", "green"
+            )
+            self._set_label_text(
+                self.template_status_label, self.template_status_var,
+                "✅ Template cargado - Ahora arrastra en la imagen", "green"
+            )
 
-                # Show position controls
-                self.position_frame.pack(fill=tk.X, pady=(5, 0))
+            # Switch to template editing mode
+            self._clear_selection()
+            self.editing_mode = "template"
 
-            except Exception as e:
-                error_msg = f"Error cargando template: {e}"
-                logger.error(error_msg)
-                messagebox.showerror("Error", error_msg)
+            # Show template immediately in center of image
+            self._show_template_on_image()
 
-                # Reset UI state on error
-                self.template_info_label.config(text="❌ Error cargando template", foreground="red")
-                self.template_status_label.config(text="", foreground="black")
+            # Show position controls
+            self.position_frame.pack(fill=tk.X, pady=(5, 0))
+
+        except Exception as e:
+            error_msg = f"Error cargando template: {e}"
+            logger.error(error_msg)
+            messagebox.showerror("Error", error_msg)
+
+            # Reset UI state on error
+            self._set_label_text(
+                self.template_info_label, self.template_info_var,
+                "❌ Error cargando template", "red"
+            )
+            self._set_label_text(self.template_status_label, self.template_status_var, "", "black")
 
     def _show_template_on_image(self):
         """Show the loaded template on the image at center position"""
@@ -2355,15 +2462,15 @@ class ConfigDesigner:
 
         # Update editing indicator
         template_info = self.template_references[self.selected_template_id]
-        self.editing_indicator.config(
-            text=f"🎯 Creando nuevo logo: {template_info['filename']}",
-            foreground="orange"
+        self._set_label_text(
+            self.editing_indicator, self.editing_indicator_var,
+            f"🎯 Creando nuevo logo: {template_info['filename']}", "orange"
         )
 
         # Update status
-        self.template_status_label.config(
-            text="🎯 Arrastra el template en la imagen o usa campos numéricos para posicionar",
-            foreground="blue"
+        self._set_label_text(
+            self.template_status_label, self.template_status_var,
+            "🎯 Arrastra el template en la imagen o usa campos numéricos para posicionar", "blue"
         )
 
     def _update_image_with_template_overlay_manager(self):
@@ -2426,10 +2533,12 @@ class ConfigDesigner:
         scale_y = canvas_height / img_height
         self.canvas_scale = min(scale_x, scale_y) * 0.9  # Leave some margin
 
-        # Resize image
+        # Resize image (cheap nearest-neighbour while dragging, smooth otherwise)
         new_width = int(img_width * self.canvas_scale)
         new_height = int(img_height * self.canvas_scale)
-        image_resized = cv2.resize(image_rgb, (new_width, new_height))
+        dragging = self.dragging_template or self.dragging_logo
+        interpolation = cv2.INTER_NEAREST if dragging else cv2.INTER_LINEAR
+        image_resized = cv2.resize(image_rgb, (new_width, new_height), interpolation=interpolation)
 
         # Convert to PIL and then to PhotoImage
         pil_image = Image.fromarray(image_resized)
@@ -2461,7 +2570,10 @@ class ConfigDesigner:
             return
 
         # Enable template positioning mode
-        self.template_info_label.config(text="Modo posicionamiento: Click y arrastra en la imagen", foreground="blue")
+        self._set_label_text(
+            self.template_info_label, self.template_info_var,
+            "Modo posicionamiento: Click y arrastra en la imagen", "blue"
+        )
         messagebox.showinfo("Posicionamiento",
                            "Click en la imagen donde quieres posicionar el logo y arrastra para ajustar el tamaño.\n"
                            "Presiona 'Confirmar Logo' cuando esté en la posición correcta.")
@@ -2542,9 +2654,9 @@ class ConfigDesigner:
                 # If clicking near logo (within 50 pixels), start dragging
                 if click_distance < 50:
                     self.dragging_logo = True
-                    self.template_status_label.config(
-                        text="🚀 Arrastrando logo...",
-                        foreground="orange"
+                    self._set_label_text(
+                        self.template_status_label, self.template_status_var,
+                        "🚀 Arrastrando logo...", "orange"
                     )
 
         elif self.selected_template_id:
@@ -2557,9 +2669,9 @@ class ConfigDesigner:
                 # If clicking near template (within 50 pixels), start dragging
                 if click_distance < 50:
                     self.dragging_template = True
-                    self.template_status_label.config(
-                        text="🚀 Arrastrando template...",
-                        foreground="orange"
+                    self._set_label_text(
+                        self.template_status_label, self.template_status_var,
+                        "🚀 Arrastrando template...", "orange"
                     )
                 else:
                     # Clicking outside template area - confirm logo creation
@@ -2577,33 +2689,41 @@ class ConfigDesigner:
         if distance > 5:  # Minimum drag distance threshold
             self.is_dragging = True
 
+            # Stash the latest position; the idle redraw applies it once per frame
             if self.dragging_logo:
-                # Move selected logo to new position
-                self._move_logo_to_canvas_position(event.x, event.y)
+                self._pending_drag = ("logo", event.x, event.y)
+                self._request_redraw()
             elif self.dragging_template:
-                # Move template to new position
-                self._move_template_to_canvas_position(event.x, event.y)
+                self._pending_drag = ("template", event.x, event.y)
+                self._request_redraw()
 
     def _on_canvas_release(self, event=None):
         """Handle canvas release - stop dragging"""
+        was_dragging = self.dragging_logo or self.dragging_template
+
         if self.dragging_logo:
             self.dragging_logo = False
-            selected_logo = self.current_style.logos[self.selected_logo_index]
-            self.template_status_label.config(
-                text=f"✅ Logo '{selected_logo.name}' reposicionado",
-                foreground="green"
-            )
+            selected_logo = self._active_logo
+            if selected_logo is not None:
+                self._set_label_text(
+                    self.template_status_label, self.template_status_var,
+                    f"✅ Logo '{selected_logo.name}' reposicionado", "green"
+                )
         elif self.dragging_template:
             self.dragging_template = False
-            self.template_status_label.config(
-                text="✅ Template posicionado - Click fuera del template para confirmar",
-                foreground="green"
+            self._set_label_text(
+                self.template_status_label, self.template_status_var,
+                "✅ Template posicionado - Click fuera del template para confirmar", "green"
             )
 
         # Reset drag state
         self.is_dragging = False
         self.drag_start_pos = None
 
+        # Final full-quality render after the fast drag previews
+        if was_dragging:
+            self._request_redraw()
+
     def _get_template_canvas_position(self):
         """Get template center position in canvas coordinates"""
         if not self.selected_template_id or self.canvas_scale <= 0:
@@ -2626,8 +2746,8 @@ class ConfigDesigner:
         selected_logo = self.current_style.logos[self.selected_logo_index]
 
         # Convert mm coordinates to pixel coordinates, then to canvas coordinates
-        logo_x_px = selected_logo.position_mm.x / self.mm_per_pixel
-        logo_y_px = selected_logo.position_mm.y / self.mm_per_pixel
+        logo_x_px = selected_logo.position_mm.x * self._px_per_mm
+        logo_y_px = selected_logo.position_mm.y * self._px_per_mm
 
         canvas_x = logo_x_px * self.canvas_scale
         canvas_y = logo_y_px * self.canvas_scale
@@ -2636,10 +2756,8 @@ class ConfigDesigner:
 
     def _move_logo_to_canvas_position(self, canvas_x, canvas_y):
         """Move selected logo to canvas position and update fields"""
-        if not self.current_style or self.selected_logo_index is None:
-            return
-
-        if self.selected_logo_index >= len(self.current_style.logos):
+        selected_logo = self._active_logo
+        if selected_logo is None:
             return
 
         # Convert canvas coordinates to image coordinates
@@ -2651,7 +2769,6 @@ class ConfigDesigner:
         pos_y_mm = img_y * self.mm_per_pixel
 
         # Update logo position
-        selected_logo = self.current_style.logos[self.selected_logo_index]
         selected_logo.position_mm.x = pos_x_mm
         selected_logo.position_mm.y = pos_y_mm
 
@@ -2659,15 +2776,13 @@ class ConfigDesigner:
         selected_logo.roi.x = pos_x_mm - selected_logo.roi.width / 2
         selected_logo.roi.y = pos_y_mm - selected_logo.roi.height / 2
 
-        # Update position fields
+        # Update position fields (display is refreshed by the caller)
+        self._last_broadcast = None
         self.updating_from_drag = True
-        self.pos_x_var.set(round(pos_x_mm, 2))
-        self.pos_y_var.set(round(pos_y_mm, 2))
+        self.pos_x_var.set(f"{pos_x_mm:.2f}")
+        self.pos_y_var.set(f"{pos_y_mm:.2f}")
         self.updating_from_drag = False
 
-        # Update display
-        self._display_image()
-
     def _move_template_to_canvas_position(self, canvas_x, canvas_y):
         """Move template to new position based on canvas coordinates"""
         if self.canvas_scale <= 0:
@@ -2677,12 +2792,9 @@ class ConfigDesigner:
         img_x = int(canvas_x / self.canvas_scale)
         img_y = int(canvas_y / self.canvas_scale)
 
-        # Update template position
+        # Update template position (display is refreshed by the caller)
         self.template_position = (img_x, img_y)
 
-        # Update display
-        self._update_image_with_template_overlay_manager()
-
         # Update position fields in real time
         self._update_position_fields()
 
@@ -2737,23 +2849,20 @@ class ConfigDesigner:
 
             # Clear template and update UI
             self._clear_template_overlay()
-            self._update_logo_list()
-            self._display_image()  # Refresh display without template
-
-            # Switch to "none" editing mode
-            self.editing_mode = "none"
-            self.selected_logo_index = None
+            self._update_logo_list(action="add")
 
             # Update status
-            self.template_status_label.config(
-                text=f"✅ Logo '{logo_id}' agregado a la lista!",
-                foreground="green"
+            self._set_label_text(
+                self.template_status_label, self.template_status_var,
+                f"✅ Logo '{logo_id}' agregado a la lista!", "green"
             )
 
             # Auto-select the newly created logo in the list
-            if self.current_style and self.current_style.logos:
-                self.selected_logo_index = len(self.current_style.logos) - 1
-                self._on_logo_selected()
+            self.selected_logo_index = len(self.current_style.logos) - 1
+            self._on_logo_selected(redraw=False)
+
+            # Single redraw without template, with the new logo highlighted
+            self._request_redraw()
 
             messagebox.showinfo("Logo Creado", f"Logo '{logo_id}' agregado en posición ({pos_x_mm:.1f}, {pos_y_mm:.1f}) mm\n\nAhora aparece en la lista de logos.")
 
@@ -2769,20 +2878,32 @@ class ConfigDesigner:
         self.dragging_logo = False
 
         # Reset UI
-        self.template_info_label.config(text="📁 Sin template cargado", foreground="gray")
-        self.template_status_label.config(text="", foreground="black")
-        self.editing_indicator.config(text="", foreground="black")
+        self._set_label_text(
+            self.template_info_label, self.template_info_var,
+            "📁 Sin template cargado", "gray"
+        )
+        self._set_label_text(self.template_status_label, self.template_status_var, "", "black")
+        self._set_label_text(self.editing_indicator, self.editing_indicator_var, "", "black")
 
         # Hide position controls
         self.position_frame.pack_forget()
 
     # Logo selection and editing methods
-    def _on_logo_selected(self):
+    def _clear_selection(self):
+        """Drop the logo selection: index, resolved logo and logo editing mode together"""
+        self.selected_logo_index = None
+        self._active_logo = None
+        self.dragging_logo = False
+        if self.editing_mode == "logo":
+            self.editing_mode = "none"
+
+    def _on_logo_selected(self, redraw: bool = True):
         """Handle logo selection from list"""
         if not self.current_style or self.selected_logo_index is None:
             return
 
         if self.selected_logo_index >= len(self.current_style.logos):
+            self._clear_selection()
             return
 
         # Get selected logo
@@ -2794,102 +2915,116 @@ class ConfigDesigner:
         # Clear any active template
         if self.selected_template_id:
             self._clear_template_overlay()
+        self._active_logo = selected_logo
 
         # Show position controls for selected logo
         self.position_frame.pack(fill=tk.X, pady=(5, 0))
 
         # Update editing indicator
-        self.editing_indicator.config(
-            text=f"✏️ Editando logo: {selected_logo.name}",
-            foreground="green"
+        self._set_label_text(
+            self.editing_indicator, self.editing_indicator_var,
+            f"✏️ Editando logo: {selected_logo.name}", "green"
         )
 
         # Update position fields with logo data
+        self._last_broadcast = None
         self.updating_from_drag = True
-        self.pos_x_var.set(round(selected_logo.position_mm.x, 2))
-        self.pos_y_var.set(round(selected_logo.position_mm.y, 2))
-        self.width_var.set(round(selected_logo.roi.width, 2))
-        self.height_var.set(round(selected_logo.roi.height, 2))
+        self.pos_x_var.set(f"{selected_logo.position_mm.x:.2f}")
+        self.pos_y_var.set(f"{selected_logo.position_mm.y:.2f}")
+        self.width_var.set(f"{selected_logo.roi.width:.2f}")
+        self.height_var.set(f"{selected_logo.roi.height:.2f}")
         self.updating_from_drag = False
 
         # Update UI status
-        self.template_status_label.config(
-            text=f"📝 Usa los campos numéricos o arrastra el logo en la imagen para modificar posición",
-            foreground="blue"
+        self._set_label_text(
+            self.template_status_label, self.template_status_var,
+            f"📝 Usa los campos numéricos o arrastra el logo en la imagen para modificar posición", "blue"
         )
 
-        # Highlight logo in image
-        self._highlight_selected_logo()
-
-    def _highlight_selected_logo(self):
-        """Highlight the selected logo in the image"""
-        self._display_image()  # This will redraw with highlighting
+        # Highlight logo in image (single coalesced redraw)
+        if redraw:
+            self._request_redraw()
 
     # Position control methods
     def _update_position_fields(self):
         """Update position fields based on current template position"""
-        if not self.updating_from_drag:
-            self.updating_from_drag = True
+        if self.updating_from_drag:
+            return
 
-            # Convert to mm coordinates
-            pos_x_mm = self.template_position[0] * self.mm_per_pixel
-            pos_y_mm = self.template_position[1] * self.mm_per_pixel
+        # Skip if the fields already show this template state
+        broadcast = (self.template_position, self.template_size, self.template_size_mm, self.mm_per_pixel)
+        if broadcast == self._last_broadcast:
+            return
+        self._last_broadcast = broadcast
 
-            # Update position fields
-            self.pos_x_var.set(round(pos_x_mm, 2))
-            self.pos_y_var.set(round(pos_y_mm, 2))
+        self.updating_from_drag = True
 
-            # Update size fields using correct dimensions from template_overlay_manager
-            if self.template_size_mm:
-                # Usar las dimensiones ya calculadas correctamente por template_overlay_manager
-                width_mm, height_mm = self.template_size_mm
-                self.width_var.set(round(width_mm, 2))
-                self.height_var.set(round(height_mm, 2))
-            else:
-                # Fallback: calcular con factor por defecto si no hay dimensiones
-                width_mm = self.template_size[0] * (25.4 / 300.0)  # Asumir 300 DPI
-                height_mm = self.template_size[1] * (25.4 / 300.0)
-                self.width_var.set(round(width_mm, 2))
-                self.height_var.set(round(height_mm, 2))
+        # Convert to mm coordinates
+        pos_x_mm = self.template_position[0] * self.mm_per_pixel
+        pos_y_mm = self.template_position[1] * self.mm_per_pixel
 
-            # Update size display
-            self.template_size_label.config(text=f"{self.template_size[0]}×{self.template_size[1]}px")
+        # Update position fields
+        self.pos_x_var.set(f"{pos_x_mm:.2f}")
+        self.pos_y_var.set(f"{pos_y_mm:.2f}")
+
+        # Update size fields using correct dimensions from template_overlay_manager
+        if self.template_size_mm:
+            # Usar las dimensiones ya calculadas correctamente por template_overlay_manager
+            width_mm, height_mm = self.template_size_mm
+            self.width_var.set(f"{width_mm:.2f}")
+            self.height_var.set(f"{height_mm:.2f}")
+        else:
+            # Fallback: calcular con factor por defecto si no hay dimensiones
+            width_mm = self.template_size[0] * (25.4 / 300.0)  # Asumir 300 DPI
+            height_mm = self.template_size[1] * (25.4 / 300.0)
+            self.width_var.set(f"{width_mm:.2f}")
+            self.height_var.set(f"{height_mm:.2f}")
+
+        # Update size display
+        self._set_label_text(
+            self.template_size_label, self.template_size_var,
+            f"{self.template_size[0]}×{self.template_size[1]}px"
+        )
 
-            self.updating_from_drag = False
+        self.updating_from_drag = False
 
     def _on_position_changed(self, *args):
         """Handle position field changes - works for both templates and logos"""
         if self.updating_from_drag:
             return
 
+        # Fields now hold user input, not the last broadcast template state
+        self._last_broadcast = None
+
         try:
             # Get values from fields
-            pos_x_mm = self.pos_x_var.get()
-            pos_y_mm = self.pos_y_var.get()
+            pos_x_mm = float(self.pos_x_var.get())
+            pos_y_mm = float(self.pos_y_var.get())
 
             if self.editing_mode == "template" and self.selected_template_id:
                 # Update template position
-                pos_x_img = int(pos_x_mm / self.mm_per_pixel)
-                pos_y_img = int(pos_y_mm / self.mm_per_pixel)
+                pos_x_img = int(pos_x_mm * self._px_per_mm)
+                pos_y_img = int(pos_y_mm * self._px_per_mm)
                 self.template_position = (pos_x_img, pos_y_img)
                 self._update_image_with_template_overlay_manager()
 
-            elif self.editing_mode == "logo" and self.selected_logo_index is not None:
+            elif self.editing_mode == "logo":
                 # Update selected logo position
-                if self.current_style and self.selected_logo_index < len(self.current_style.logos):
-                    logo = self.current_style.logos[self.selected_logo_index]
-                    logo.position_mm.x = pos_x_mm
-                    logo.position_mm.y = pos_y_mm
-                    # Update ROI center as well
-                    width = logo.roi.width
-                    height = logo.roi.height
-                    logo.roi.x = pos_x_mm - width/2
-                    logo.roi.y = pos_y_mm - height/2
-                    self._display_image()
-
-
-        except (ValueError, tk.TclError):
-            # Ignore invalid input
+                logo = self._active_logo
+                if logo is None:
+                    return
+                logo.position_mm.x = pos_x_mm
+                logo.position_mm.y = pos_y_mm
+                # Update ROI center as well
+                width = logo.roi.width
+                height = logo.roi.height
+                logo.roi.x = pos_x_mm - width/2
+                logo.roi.y = pos_y_mm - height/2
+                self._display_image()
+
+
+        except ValueError:
+            # Ignore incomplete input ("", "-", ".")
             pass
 
     def _on_size_changed(self, *args):
@@ -2897,15 +3032,18 @@ class ConfigDesigner:
         if self.updating_from_drag:
             return
 
+        # Fields now hold user input, not the last broadcast template state
+        self._last_broadcast = None
+
         try:
             # Get values from fields
-            width_mm = self.width_var.get()
-            height_mm = self.height_var.get()
+            width_mm = float(self.width_var.get())
+            height_mm = float(self.height_var.get())
 
             if self.editing_mode == "template" and self.selected_template_id:
                 # Convert to pixels
-                width_px = int(width_mm / self.mm_per_pixel)
-                height_px = int(height_mm / self.mm_per_pixel)
+                width_px = int(width_mm * self._px_per_mm)
+                height_px = int(height_mm * self._px_per_mm)
 
                 # Update template size
                 self.template_size = (width_px, height_px)
@@ -2915,22 +3053,26 @@ class ConfigDesigner:
                 self._update_image_with_template_overlay_manager()
 
                 # Update size display
-                self.template_size_label.config(text=f"{width_px}×{height_px}px")
+                self._set_label_text(
+                    self.template_size_label, self.template_size_var,
+                    f"{width_px}×{height_px}px"
+                )
 
-            elif self.editing_mode == "logo" and self.selected_logo_index is not None:
+            elif self.editing_mode == "logo":
                 # Update selected logo ROI size
-                if self.current_style and self.selected_logo_index < len(self.current_style.logos):
-                    logo = self.current_style.logos[self.selected_logo_index]
-                    logo.roi.width = width_mm
-                    logo.roi.height = height_mm
-                    # Re-center ROI around position
-                    logo.roi.x = logo.position_mm.x - width_mm/2
-                    logo.roi.y = logo.position_mm.y - height_mm/2
-                    self._display_image()
-
-
-        except (ValueError, tk.TclError):
-            # Ignore invalid input
+                logo = self._active_logo
+                if logo is None:
+                    return
+                logo.roi.width = width_mm
+                logo.roi.height = height_mm
+                # Re-center ROI around position
+                logo.roi.x = logo.position_mm.x - width_mm/2
+                logo.roi.y = logo.position_mm.y - height_mm/2
+                self._display_image()
+
+
+        except ValueError:
+            # Ignore incomplete input ("", "-", ".")
             pass
 
     def _center_template(self):
@@ -2950,12 +3092,18 @@ class ConfigDesigner:
         self._update_image_with_template_overlay_manager()
         self._update_position_fields()
 
-        self.template_status_label.config(text="📍 Template centrado", foreground="green")
+        self._set_label_text(
+            self.template_status_label, self.template_status_var,
+            "📍 Template centrado", "green"
+        )
 
     def _cancel_template(self):
         """Cancel template placement and clear everything"""
         self._clear_template_overlay()
-        self.template_status_label.config(text="❌ Template cancelado", foreground="red")
+        self._set_label_text(
+            self.template_status_label, self.template_status_var,
+            "❌ Template cancelado", "red"
+        )
 
     def _handle_template_placement(self, canvas_x, canvas_y):
         """Handle template placement at canvas coordinates"""
@@ -2982,9 +3130,9 @@ class ConfigDesigner:
                 template_height_mm = template_info['size'][0] * (25.4 / 300.0)
 
             # Update template info to show position
-            self.template_info_label.config(
-                text=f"Template posicionado en: ({pos_x_mm:.1f}, {pos_y_mm:.1f}) mm",
-                foreground="blue"
+            self._set_label_text(
+                self.template_info_label, self.template_info_var,
+                f"Template posicionado en: ({pos_x_mm:.1f}, {pos_y_mm:.1f}) mm", "blue"
             )
 
     def _save_current_configuration(self):
@@ -3008,32 +3156,28 @@ class ConfigDesigner:
                 'size': self.current_size,
                 'part': self.current_part,
                 'calibration_factor': self.mm_per_pixel,
-                'logos': []
+                'logos': [
+                    {
+                        'id': logo_id,
+                        'name': name,
+                        'position_mm': {'x': pos_x, 'y': pos_y},
+                        'roi': {'x': roi_x, 'y': roi_y, 'width': roi_w, 'height': roi_h},
+                        'tolerance_mm': tolerance,
+                        'detector_type': detector
+                    }
+                    for logo_id, name, pos_x, pos_y, roi_x, roi_y, roi_w, roi_h, tolerance, detector
+                    in map(LOGO_FIELDS_GETTER, self.current_style.logos)
+                ]
             }
 
-            # Add logos
-            for logo in self.current_style.logos:
-                logo_data = {
-                    'id': logo.id,
-                    'name': logo.name,
-                    'position_mm': {
-                        'x': logo.position_mm.x,
-                        'y': logo.position_mm.y
-                    },
-                    'roi': {
-                        'x': logo.roi.x,
-                        'y': logo.roi.y,
-                        'width': logo.roi.width,
-                        'height': logo.roi.height
-                    },
-                    'tolerance_mm': logo.tolerance_mm,
-                    'detector_type': logo.detector_type
-                }
-                config_data['logos'].append(logo_data)
-
-            # Save to file
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            # Save to file in a single write (orjson if available)
+            if ORJSON_AVAILABLE:
+                config_path.write_bytes(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+            else:
+                config_path.write_text(
+                    json.dumps(config_data, indent=2, ensure_ascii=False), encoding='utf-8'
+                )
+            self.preset_manager.invalidate_listing_cache()
 
             messagebox.showinfo("Éxito", f"Configuración guardada en:\n{config_path}")
             logger.info(f"Configuration saved: {config_path}")
@@ -3051,6 +3195,7 @@ class ConfigDesigner:
             self.design_combo['values'] = sorted(designs)
 
         self.root.mainloop()
+        self._template_executor.shutdown(wait=False)
 
     def _draw_rulers_and_grid(self, canvas_width, canvas_height):
         """Draw rulers and grid overlay on canvas"""
@@ -3059,11 +3204,11 @@ class ConfigDesigner:
 
         # Use minimum calibration if not set
         if self.mm_per_pixel <= 0:
-            self.mm_per_pixel = 1.0
+            self._set_calibration(1.0)
 
         # Calculate spacing with minimum limits
-        ruler_spacing_px = max(self.MIN_RULER_SPACING, self.ruler_spacing_mm / self.mm_per_pixel * self.canvas_scale)
-        grid_spacing_px = max(self.MIN_GRID_SPACING, self.grid_spacing_mm / self.mm_per_pixel * self.canvas_scale)
+        ruler_spacing_px = max(self.MIN_RULER_SPACING, self.ruler_spacing_mm * self._px_per_mm * self.canvas_scale)
+        grid_spacing_px = max(self.MIN_GRID_SPACING, self.grid_spacing_mm * self._px_per_mm * self.canvas_scale)
 
         # Draw grid first (background)
         if self.grid_var.get():
@@ -3285,7 +3430,7 @@ class ConfigDesigner:
         )
 
         self.current_style.logos.append(new_logo)
-        self._update_logo_list()
+        self._update_logo_list(action="add")
         messagebox.showinfo("Éxito", f"Logo '{logo_name}' agregado")
 
     def _remove_logo(self):
@@ -3305,20 +3450,44 @@ class ConfigDesigner:
         result = messagebox.askyesno("Confirmar", f"¿Eliminar logo '{logo.name}'?")
         if result:
             self.current_style.logos.pop(index)
-            self._update_logo_list()
+            self._clear_selection()
+            self._update_logo_list(index, action="remove")
             messagebox.showinfo("Éxito", f"Logo '{logo.name}' eliminado")
 
-    def _update_logo_list(self):
-        """Update the logo list display"""
+    def _update_logo_list(self, changed_index: Optional[int] = None, action: Optional[str] = None):
+        """
+        Update the logo list display
+
+        Without an action the list is fully rebuilt (e.g. after loading from disk).
+        'add' appends the last logo, 'remove' deletes the entry at changed_index and
+        'update' refreshes only the entry at changed_index.
+        """
         if not self.logo_list:
             return
 
-        self.logo_list.delete(0, tk.END)
+        if action is None or not self.current_style:
+            self.logo_list.delete(0, tk.END)
+            if self.current_style:
+                for logo in self.current_style.logos:
+                    self.logo_list.insert(tk.END, self._format_logo_list_entry(logo))
+            return
 
-        if self.current_style:
-            for logo in self.current_style.logos:
-                display_text = f"{logo.name} ({logo.position_mm.x:.1f}, {logo.position_mm.y:.1f}mm)"
-                self.logo_list.insert(tk.END, display_text)
+        logos = self.current_style.logos
+        if action == "add":
+            self.logo_list.insert(tk.END, self._format_logo_list_entry(logos[-1]))
+        elif action == "remove":
+            self.logo_list.delete(changed_index)
+        elif action == "update":
+            was_selected = self.logo_list.selection_includes(changed_index)
+            self.logo_list.delete(changed_index)
+            self.logo_list.insert(changed_index, self._format_logo_list_entry(logos[changed_index]))
+            if was_selected:
+                self.logo_list.selection_set(changed_index)
+
+    @staticmethod
+    def _format_logo_list_entry(logo: Logo) -> str:
+        """Format a logo for the logo list"""
+        return f"{logo.name} ({logo.position_mm.x:.1f}, {logo.position_mm.y:.1f}mm)"
 
 
 def main():
@@ -5,7 +5,7 @@ Extraído de ConfigDesigner para seguir principio de responsabilidad única
 import cv2
 import numpy as np
 from PIL import Image, ImageTk
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 import tkinter as tk
 from pathlib import Path
 
@@ -19,6 +19,9 @@ class ImageProcessor:
     MAX_CANVAS_WIDTH = 800
     MAX_CANVAS_HEIGHT = 600
     DEFAULT_SCALE = 1.0
+    # Tamaños redimensionados que se conservan por procesador (al cambiar el
+    # tamaño arrastrando se generan muchos que no se vuelven a usar)
+    MAX_RESIZED_TEMPLATES = 32
 
     def __init__(self):
         """Inicializar ImageProcessor"""
@@ -31,6 +34,8 @@ class ImageProcessor:
         self.template_references: Dict[str, Dict] = {}
         self.current_template_overlay: Optional[np.ndarray] = None
         self.template_positions: Dict[str, Dict] = {}
+        # Templates ya redimensionados, por (template_id, (width, height))
+        self._resized_templates: Dict[Tuple[str, Tuple[int, int]], np.ndarray] = {}
 
     def load_image(self, file_path: str) -> bool:
         """
@@ -76,13 +81,16 @@ class ImageProcessor:
         scale_y = self.MAX_CANVAS_HEIGHT / image_height
         return min(scale_x, scale_y, 1.0)  # No aumentar más allá del tamaño original
 
-    def resize_image_for_display(self, image: np.ndarray, scale: float) -> np.ndarray:
+    def resize_image_for_display(self, image: np.ndarray, scale: float,
+                                 fast_preview: bool = False) -> np.ndarray:
         """
         Redimensionar imagen para visualización
 
         Args:
             image: Imagen a redimensionar
             scale: Factor de escala
+            fast_preview: Usar INTER_NEAREST (mucho más rápido que INTER_AREA
+                al reducir imágenes grandes) en lugar de INTER_AREA
 
         Returns:
             Imagen redimensionada
@@ -91,24 +99,36 @@ class ImageProcessor:
             return image
 
         height, width = image.shape[:2]
-        new_width = int(width * scale)
-        new_height = int(height * scale)
+        new_width = round(width * scale)
+        new_height = round(height * scale)
 
-        return cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
+        interpolation = cv2.INTER_NEAREST if fast_preview else cv2.INTER_AREA
+        return cv2.resize(image, (new_width, new_height), interpolation=interpolation)
 
     def convert_cv2_to_pil(self, cv2_image: np.ndarray) -> Image.Image:
         """
         Convertir imagen OpenCV a PIL
 
         Args:
-            cv2_image: Imagen en formato OpenCV (BGR)
+            cv2_image: Imagen en formato OpenCV (gris, BGR o BGRA)
 
         Returns:
-            Imagen en formato PIL (RGB)
+            Imagen en formato PIL (L, RGB o RGBA)
+
+        Raises:
+            ValueError: Si el número de canales no es 1, 3 o 4
         """
-        # Convertir de BGR a RGB
-        rgb_image = cv2.cvtColor(cv2_image, cv2.COLOR_BGR2RGB)
-        return Image.fromarray(rgb_image)
+        channels = 1 if cv2_image.ndim == 2 else cv2_image.shape[2]
+        if channels == 1:
+            return Image.fromarray(cv2_image.reshape(cv2_image.shape[:2]))
+        if channels == 3:
+            # BGR -> RGB como vista invertida de canales (sin cvtColor ni buffer
+            # intermedio); PIL copia los datos una sola vez al construir la imagen
+            return Image.fromarray(cv2_image[:, :, ::-1])
+        if channels == 4:
+            # Invertir solo B, G, R; alfa se queda al final
+            return Image.fromarray(cv2_image[:, :, [2, 1, 0, 3]])
+        raise ValueError(f"Número de canales no soportado: {channels}")
 
     def create_photo_image(self, image: np.ndarray) -> ImageTk.PhotoImage:
         """
@@ -123,12 +143,15 @@ class ImageProcessor:
         pil_image = self.convert_cv2_to_pil(image)
         return ImageTk.PhotoImage(pil_image)
 
-    def prepare_image_for_canvas(self, image: Optional[np.ndarray] = None) -> Optional[ImageTk.PhotoImage]:
+    def prepare_image_for_canvas(self, image: Optional[np.ndarray] = None,
+                                 fast_preview: bool = False) -> Optional[ImageTk.PhotoImage]:
         """
         Preparar imagen para mostrar en canvas
 
         Args:
             image: Imagen opcional, usa current_image si no se proporciona
+            fast_preview: Redimensionar con INTER_NEAREST (solo para redibujados
+                interactivos, p. ej. al arrastrar; el render final debe usar False)
 
         Returns:
             PhotoImage preparado o None si no hay imagen
@@ -145,7 +168,7 @@ class ImageProcessor:
             self.canvas_scale = self.calculate_canvas_scale(width, height)
 
         # Redimensionar imagen
-        display_image = self.resize_image_for_display(image, self.canvas_scale)
+        display_image = self.resize_image_for_display(image, self.canvas_scale, fast_preview)
 
         # Crear PhotoImage
         self.photo_image = self.create_photo_image(display_image)
@@ -168,6 +191,7 @@ class ImageProcessor:
                 raise ValueError(f"No se pudo cargar el template: {template_path}")
 
             self.logo_templates[template_id] = template_image
+            self._discard_resized_templates(template_id)
             self.template_references[template_id] = {
                 'path': template_path,
                 'original_size': template_image.shape[:2]
@@ -180,7 +204,8 @@ class ImageProcessor:
             return False
 
     def create_template_overlay(self, template_id: str, position: Tuple[int, int],
-                              size: Tuple[int, int]) -> Optional[np.ndarray]:
+                              size: Tuple[int, int],
+                              dst: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """
         Crear overlay de template sobre la imagen actual
 
@@ -188,6 +213,9 @@ class ImageProcessor:
             template_id: ID del template
             position: Posición (x, y) en píxeles de imagen
             size: Tamaño (width, height) en píxeles
+            dst: Array opcional donde componer el overlay (se reutiliza si
+                coincide con la forma y tipo de la imagen actual); sin él se
+                devuelve una copia nueva
 
         Returns:
             Imagen con overlay o None si no es posible
@@ -196,24 +224,35 @@ class ImageProcessor:
             return None
 
         try:
-            # Copiar imagen base
-            overlay_image = self.current_image.copy()
-
-            # Obtener template
-            template = self.logo_templates[template_id]
-
-            # Redimensionar template al tamaño deseado
-            resized_template = cv2.resize(template, size, interpolation=cv2.INTER_AREA)
+            # Redimensionar template al tamaño deseado (solo si cambió el tamaño;
+            # al arrastrar solo cambia la posición)
+            key = (template_id, tuple(size))
+            resized_template = self._resized_templates.get(key)
+            if resized_template is None:
+                resized_template = cv2.resize(
+                    self.logo_templates[template_id], size, interpolation=cv2.INTER_AREA
+                )
+                if len(self._resized_templates) >= self.MAX_RESIZED_TEMPLATES:
+                    del self._resized_templates[next(iter(self._resized_templates))]
+                self._resized_templates[key] = resized_template
 
             # Calcular posición de inserción
             x, y = position
             h, w = resized_template.shape[:2]
 
             # Verificar que el template cabe en la imagen
-            img_h, img_w = overlay_image.shape[:2]
+            img_h, img_w = self.current_image.shape[:2]
             if x + w > img_w or y + h > img_h or x < 0 or y < 0:
                 return None
 
+            # Copiar imagen base (sobre dst si sirve, sin reservar memoria nueva)
+            if (dst is not None and dst.shape == self.current_image.shape
+                    and dst.dtype == self.current_image.dtype):
+                overlay_image = dst
+                np.copyto(overlay_image, self.current_image)
+            else:
+                overlay_image = self.current_image.copy()
+
             # Crear máscara para transparencia (opcional)
             # Por ahora, simplemente copiamos el template
             overlay_image[y:y+h, x:x+w] = resized_template
@@ -239,9 +278,11 @@ class ImageProcessor:
             'size': size
         }
 
-        # Actualizar overlay
+        # Actualizar overlay; el overlay actual se recompone en su propio
+        # array (solo esta operación lo modifica), sin reservar uno nuevo
+        # en cada movimiento
         self.current_template_overlay = self.create_template_overlay(
-            template_id, position, size
+            template_id, position, size, dst=self.current_template_overlay
         )
 
     def get_template_info(self, template_id: str) -> Optional[Dict]:
@@ -295,6 +336,45 @@ class ImageProcessor:
         y_px = int(y_mm / mm_per_pixel)
         return x_px, y_px
 
+    def _mm_to_canvas_factor(self, mm_per_pixel: float) -> float:
+        """Factor mm -> píxeles de canvas (sin calibración se toman los mm como píxeles)"""
+        if mm_per_pixel > 0:
+            return self.canvas_scale / mm_per_pixel
+        return self.canvas_scale
+
+    def calculate_logos_canvas_positions(self, logos: List[Logo], mm_per_pixel: float) -> np.ndarray:
+        """
+        Calcular posiciones de varios logos en el canvas de una sola vez
+
+        Args:
+            logos: Lista de logos con posición en mm
+            mm_per_pixel: Factor de calibración
+
+        Returns:
+            Array (N, 2) int32 con posiciones (x, y) en píxeles del canvas
+        """
+        positions = np.array(
+            [(logo.position_mm.x, logo.position_mm.y) for logo in logos], dtype=np.float64
+        ).reshape(-1, 2)
+        return (positions * self._mm_to_canvas_factor(mm_per_pixel)).astype(np.int32)
+
+    def calculate_logos_roi_canvas(self, logos: List[Logo], mm_per_pixel: float) -> np.ndarray:
+        """
+        Calcular ROIs de varios logos en el canvas de una sola vez
+
+        Args:
+            logos: Lista de logos con ROI en mm
+            mm_per_pixel: Factor de calibración
+
+        Returns:
+            Array (N, 4) int32 con ROIs (x, y, width, height) en píxeles del canvas
+        """
+        rois = np.array(
+            [(logo.roi.x, logo.roi.y, logo.roi.width, logo.roi.height) for logo in logos],
+            dtype=np.float64
+        ).reshape(-1, 4)
+        return (rois * self._mm_to_canvas_factor(mm_per_pixel)).astype(np.int32)
+
     def calculate_logo_canvas_position(self, logo: Logo, mm_per_pixel: float) -> Tuple[int, int]:
         """
         Calcular posición de logo en el canvas con escala
@@ -341,9 +421,15 @@ class ImageProcessor:
 
         return int(roi_x), int(roi_y), int(roi_w), int(roi_h)
 
+    def _discard_resized_templates(self, template_id: str):
+        """Descartar las versiones redimensionadas de un template recargado"""
+        for key in [key for key in self._resized_templates if key[0] == template_id]:
+            del self._resized_templates[key]
+
     def clear_templates(self):
         """Limpiar todos los templates cargados"""
         self.logo_templates.clear()
+        self._resized_templates.clear()
         self.template_references.clear()
         self.template_positions.clear()
         self.current_template_overlay = None
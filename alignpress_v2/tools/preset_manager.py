@@ -6,7 +6,12 @@ import json
 import os
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from tkinter import filedialog, messagebox
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..config.models import Logo, Style, Point, Rectangle
 
@@ -23,6 +28,12 @@ class PresetManager:
         """
         self.config_root_path = config_root_path or Path("./configs")
 
+        # Listados de directorio ya leídos: (ruta, tipo) -> (firma, nombres).
+        # La firma combina inodo, mtime, enlaces y tamaño del directorio; con
+        # marcas de tiempo de baja resolución el mtime solo no basta, por eso
+        # save_preset además invalida la caché tras escribir
+        self._listing_cache: Dict[Tuple[str, str], Tuple[Tuple[int, ...], List[str]]] = {}
+
     def scan_existing_presets(self) -> Tuple[List[str], List[str], List[str]]:
         """
         Escanear presets existentes en el directorio de configuraciones
@@ -30,35 +41,71 @@ class PresetManager:
         Returns:
             Tuple con listas de (designs, sizes, parts) disponibles
         """
-        designs = []
-        sizes = []
-        parts = []
+        designs = set()
+        sizes = set()
+        parts = set()
 
         if not self.config_root_path.exists():
-            return designs, sizes, parts
+            return [], [], []
 
         try:
-            # Escanear designs (directorios de primer nivel)
-            for design_dir in self.config_root_path.iterdir():
-                if design_dir.is_dir():
-                    designs.append(design_dir.name)
-
-                    # Escanear sizes (directorios de segundo nivel)
-                    for size_dir in design_dir.iterdir():
-                        if size_dir.is_dir() and size_dir.name not in sizes:
-                            sizes.append(size_dir.name)
-
-                            # Escanear parts (archivos JSON)
-                            for part_file in size_dir.glob("*.json"):
-                                part_name = part_file.stem
-                                if part_name not in parts:
-                                    parts.append(part_name)
+            # Escanear designs (directorios de primer nivel); los directorios
+            # sin cambios cuestan un stat cada uno (ver _cached_listing)
+            for design_name in self._scan_dir_names(self.config_root_path):
+                designs.add(design_name)
+                design_path = os.path.join(self.config_root_path, design_name)
+
+                # Escanear sizes (directorios de segundo nivel); las parts se
+                # leen en cada size aunque su nombre ya exista en otro diseño
+                for size_name in self._scan_dir_names(design_path):
+                    sizes.add(size_name)
+
+                    # Escanear parts (archivos JSON)
+                    parts.update(self._scan_part_names(os.path.join(design_path, size_name)))
 
         except Exception as e:
             print(f"Error escaneando presets: {e}")
 
         return sorted(designs), sorted(sizes), sorted(parts)
 
+    def _cached_listing(self, path, kind: str) -> List[str]:
+        """
+        Listado de path ('dirs' o 'parts'), reutilizado mientras no cambie su firma
+
+        os.scandir trae el tipo de cada entrada en la misma lectura del
+        directorio, sin un stat por archivo ni objetos Path intermedios.
+        """
+        key = (os.fspath(path), kind)
+        st = os.stat(path)
+        signature = (st.st_ino, st.st_mtime_ns, st.st_nlink, st.st_size)
+        cached = self._listing_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with os.scandir(path) as entries:
+            if kind == 'dirs':
+                names = [entry.name for entry in entries if entry.is_dir()]
+            else:
+                names = [
+                    os.path.splitext(entry.name)[0] for entry in entries
+                    if entry.name.endswith('.json') and entry.is_file()
+                ]
+
+        self._listing_cache[key] = (signature, names)
+        return names
+
+    def invalidate_listing_cache(self):
+        """Descartar los listados de directorio en caché"""
+        self._listing_cache.clear()
+
+    def _scan_dir_names(self, path) -> List[str]:
+        """Nombres de los subdirectorios de path"""
+        return self._cached_listing(path, 'dirs')
+
+    def _scan_part_names(self, path) -> List[str]:
+        """Nombres (sin extensión) de los archivos .json de path"""
+        return self._cached_listing(path, 'parts')
+
     def load_preset_file(self) -> Tuple[Optional[Dict], Optional[str]]:
         """
         Abrir diálogo para seleccionar y cargar archivo de preset
@@ -66,6 +113,9 @@ class PresetManager:
         Returns:
             Tuple con (config_data, config_path) o (None, None) si se cancela
         """
+        # tkinter solo se importa al usar diálogos (escaneo sin interfaz)
+        from tkinter import filedialog, messagebox
+
         configs_dir = self.config_root_path
 
         if not configs_dir.exists():
@@ -82,13 +132,59 @@ class PresetManager:
             return None, None
 
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            return config_data, config_path
+            return self.load_preset_from_path(config_path), config_path
         except Exception as e:
             messagebox.showerror("Error", f"Error al cargar preset: {str(e)}")
             return None, None
 
+    def load_preset_from_path(self, config_path) -> Dict:
+        """
+        Cargar un preset desde su ruta, sin diálogos (apto para hilos de trabajo)
+
+        Args:
+            config_path: Ruta del archivo de preset
+
+        Returns:
+            Datos de configuración del preset
+
+        Raises:
+            OSError: Si no se puede leer el archivo
+            ValueError: Si el contenido no es JSON válido
+        """
+        return self._parse_preset_bytes(Path(config_path).read_bytes())
+
+    @staticmethod
+    def _parse_preset_bytes(data: bytes) -> Dict:
+        """Parsear los bytes UTF-8 directamente (orjson si está disponible)"""
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+    def peek_preset_metadata(self, config_path: str) -> Optional[Tuple[str, str, str]]:
+        """
+        Obtener diseño/talla/parte solo a partir de la ruta, sin abrir el archivo
+
+        Args:
+            config_path: Ruta del archivo de configuración
+
+        Returns:
+            Tuple con (design, size, part), o None si la ruta no sigue la
+            estructura <config_root>/<design>/<size>/<part>.json
+        """
+        # Operaciones puras sobre la ruta; solo se pasa a rutas absolutas
+        # (getcwd) cuando una es relativa y la otra no
+        path = Path(config_path)
+        try:
+            path_parts = path.relative_to(self.config_root_path).parts
+        except ValueError:
+            try:
+                path_parts = path.absolute().relative_to(self.config_root_path.absolute()).parts
+            except ValueError:
+                # Archivo fuera del directorio de configuraciones
+                return None
+
+        if len(path_parts) < 3:
+            return None
+        return path_parts[0], path_parts[1], os.path.splitext(path_parts[2])[0]
+
     def extract_preset_metadata(self, config_data: Dict, config_path: str) -> Tuple[str, str, str]:
         """
         Extraer metadatos de diseño/talla/parte desde la ruta del archivo o datos
@@ -100,19 +196,14 @@ class PresetManager:
         Returns:
             Tuple con (design, size, part)
         """
-        rel_path = os.path.relpath(config_path, str(self.config_root_path))
-        path_parts = rel_path.split(os.sep)
-
-        if len(path_parts) >= 3:
-            design = path_parts[0]
-            size = path_parts[1]
-            part = os.path.splitext(path_parts[2])[0]
-        else:
-            # Fallback: usar datos del archivo de configuración
-            design = config_data.get('design', 'Unknown')
-            size = config_data.get('size', 'Unknown')
-            part = config_data.get('part', 'Unknown')
-
+        metadata = self.peek_preset_metadata(config_path)
+        if metadata is not None:
+            return metadata
+
+        # Fallback: usar datos del archivo de configuración
+        design = config_data.get('design', 'Unknown')
+        size = config_data.get('size', 'Unknown')
+        part = config_data.get('part', 'Unknown')
         return design, size, part
 
     def create_logos_from_config(self, config_data: Dict) -> List[Logo]:
@@ -125,27 +216,31 @@ class PresetManager:
         Returns:
             Lista de objetos Logo creados
         """
-        logos = []
-
-        for logo_data in config_data.get('logos', []):
-            logo = Logo(
+        logos_data = config_data.get('logos', ())
+        logos = [None] * len(logos_data)
+
+        # Clases como locales: evita la búsqueda global en cada iteración
+        logo_cls, point_cls, rectangle_cls = Logo, Point, Rectangle
+
+        for index, logo_data in enumerate(logos_data):
+            get = logo_data.get
+            position = logo_data['position_mm']
+            roi = logo_data['roi']
+            # 'detector' es la clave que escribe save_preset; 'detector_type'
+            # la del diseñador. Solo se evalúa el respaldo cuando hace falta
+            if 'detector_type' in logo_data:
+                detector_type = logo_data['detector_type']
+            else:
+                detector_type = get('detector', 'template_matching')
+
+            logos[index] = logo_cls(
                 id=logo_data['id'],
                 name=logo_data['name'],
-                position_mm=Point(
-                    logo_data['position_mm']['x'],
-                    logo_data['position_mm']['y']
-                ),
-                tolerance_mm=logo_data.get('tolerance_mm', 3.0),
-                detector_type=logo_data.get('detector_type',
-                                         logo_data.get('detector', 'template_matching')),
-                roi=Rectangle(
-                    logo_data['roi']['x'],
-                    logo_data['roi']['y'],
-                    logo_data['roi']['width'],
-                    logo_data['roi']['height']
-                )
+                position_mm=point_cls(position['x'], position['y']),
+                tolerance_mm=get('tolerance_mm', 3.0),
+                detector_type=detector_type,
+                roi=rectangle_cls(roi['x'], roi['y'], roi['width'], roi['height'])
             )
-            logos.append(logo)
 
         return logos
 
@@ -163,6 +258,8 @@ class PresetManager:
         Returns:
             True si los datos son válidos, False si no
         """
+        from tkinter import messagebox
+
         if not design or not size or not part:
             messagebox.showwarning(
                 "Configuración Incompleta",
@@ -239,6 +336,8 @@ class PresetManager:
         Returns:
             True si se guardó exitosamente, False si no
         """
+        from tkinter import messagebox
+
         # Validar datos
         if not self.validate_preset_data(design, size, part, style):
             return False
@@ -263,8 +362,15 @@ class PresetManager:
                 design, size, part, style, mm_per_pixel
             )
 
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            # Serializar una vez y escribir en una sola llamada
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(
+                    config_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                payload = json.dumps(config_data, indent=2, ensure_ascii=False).encode('utf-8')
+            config_path.write_bytes(payload)
+            self.invalidate_listing_cache()
 
             messagebox.showinfo(
                 "Éxito",
@@ -291,8 +397,7 @@ class PresetManager:
 
         design_path = self.config_root_path / design
         if design_path.exists():
-            sizes = [d.name for d in design_path.iterdir() if d.is_dir()]
-            return sorted(sizes)
+            return sorted(self._scan_dir_names(design_path))
         else:
             # Tallas por defecto para diseños nuevos
             return ["TallaS", "TallaM", "TallaL", "TallaXL"]
@@ -313,8 +418,7 @@ class PresetManager:
 
         size_path = self.config_root_path / design / size
         if size_path.exists():
-            parts = [f.stem for f in size_path.glob("*.json")]
-            return sorted(parts)
+            return sorted(self._scan_part_names(size_path))
         else:
             # Partes por defecto
             return ["delantera", "trasera", "manga_izquierda", "manga_derecha"]
\ No newline at end of file
@@ -3,7 +3,9 @@ RulerGridSystem - Sistema de reglas y grid para medición visual
 Extraído de ConfigDesigner para seguir principio de responsabilidad única
 """
 import tkinter as tk
-from typing import Optional
+from typing import Optional, Tuple
+
+import numpy as np
 
 
 class RulerGridSystem:
@@ -28,9 +30,21 @@ class RulerGridSystem:
         self.canvas = canvas
         self.show_rulers = True
         self.show_grid = True
+        # Offset de las reglas, actualizado en set_visibility (se consulta en
+        # cada evento de ratón)
+        self._offset_x = self.RULER_WIDTH
+        self._offset_y = self.RULER_HEIGHT
         self.grid_spacing_mm = 10.0     # Espaciado del grid en mm
         self.ruler_spacing_mm = 10.0    # Espaciado de marcas de reglas en mm
 
+        # Parámetros con los que se dibujaron los elementos actuales; si no
+        # cambian y los elementos siguen en el canvas no se vuelven a crear
+        self._drawn_state: Optional[tuple] = None
+
+        # Espaciados en píxeles de la última calibración/escala usada
+        self._spacing_key: Optional[tuple] = None
+        self._spacings_px: Tuple[float, float] = (0.0, 0.0)
+
     def set_visibility(self, show_rulers: bool, show_grid: bool):
         """
         Configurar visibilidad de reglas y grid
@@ -41,6 +55,8 @@ class RulerGridSystem:
         """
         self.show_rulers = show_rulers
         self.show_grid = show_grid
+        self._offset_x = self.RULER_WIDTH if show_rulers else 0
+        self._offset_y = self.RULER_HEIGHT if show_rulers else 0
 
     def set_spacing(self, grid_spacing_mm: float, ruler_spacing_mm: float):
         """
@@ -57,6 +73,15 @@ class RulerGridSystem:
         """Limpiar todas las reglas y grid del canvas"""
         self.canvas.delete("ruler")
         self.canvas.delete("grid")
+        self._drawn_state = None
+
+    def _drawn_items_present(self) -> bool:
+        """Verificar que los elementos dibujados no se borraron desde fuera"""
+        if self.show_rulers:
+            return bool(self.canvas.find_withtag("ruler"))
+        if self.show_grid:
+            return bool(self.canvas.find_withtag("grid"))
+        return True
 
     def draw_rulers_and_grid(self, canvas_width: int, canvas_height: int,
                            mm_per_pixel: float, canvas_scale: float):
@@ -69,22 +94,18 @@ class RulerGridSystem:
             mm_per_pixel: Factor de calibración
             canvas_scale: Escala del canvas
         """
+        # Nada que hacer si ya está dibujado con los mismos parámetros
+        state = (
+            canvas_width, canvas_height, mm_per_pixel, canvas_scale,
+            self.show_rulers, self.show_grid, self.grid_spacing_mm, self.ruler_spacing_mm
+        )
+        if state == self._drawn_state and self._drawn_items_present():
+            return
+
         # Limpiar elementos previos
         self.clear_rulers_and_grid()
 
-        # Validar calibración
-        if mm_per_pixel <= 0:
-            mm_per_pixel = 1.0
-
-        # Calcular espaciado con límites mínimos
-        ruler_spacing_px = max(
-            self.MIN_RULER_SPACING,
-            self.ruler_spacing_mm / mm_per_pixel * canvas_scale
-        )
-        grid_spacing_px = max(
-            self.MIN_GRID_SPACING,
-            self.grid_spacing_mm / mm_per_pixel * canvas_scale
-        )
+        ruler_spacing_px, grid_spacing_px = self._get_spacings_px(mm_per_pixel, canvas_scale)
 
         # Dibujar grid primero (fondo)
         if self.show_grid:
@@ -94,6 +115,39 @@ class RulerGridSystem:
         if self.show_rulers:
             self._draw_rulers_simple(canvas_width, canvas_height, ruler_spacing_px)
 
+        self._drawn_state = state
+
+    def _get_spacings_px(self, mm_per_pixel: float, canvas_scale: float) -> Tuple[float, float]:
+        """
+        Espaciado (reglas, grid) en píxeles, recalculado solo si cambian sus entradas
+
+        Args:
+            mm_per_pixel: Factor de calibración
+            canvas_scale: Escala del canvas
+
+        Returns:
+            Tuple con (ruler_spacing_px, grid_spacing_px)
+        """
+        key = (mm_per_pixel, canvas_scale, self.ruler_spacing_mm, self.grid_spacing_mm)
+        if key != self._spacing_key:
+            # Validar calibración
+            if mm_per_pixel <= 0:
+                mm_per_pixel = 1.0
+
+            # Calcular espaciado con límites mínimos
+            ruler_spacing_px = max(
+                self.MIN_RULER_SPACING,
+                self.ruler_spacing_mm / mm_per_pixel * canvas_scale
+            )
+            grid_spacing_px = max(
+                self.MIN_GRID_SPACING,
+                self.grid_spacing_mm / mm_per_pixel * canvas_scale
+            )
+            self._spacing_key = key
+            self._spacings_px = (ruler_spacing_px, grid_spacing_px)
+
+        return self._spacings_px
+
     def _draw_grid_simple(self, canvas_width: int, canvas_height: int, spacing_px: float):
         """
         Dibujar grid simplificado
@@ -103,23 +157,39 @@ class RulerGridSystem:
             canvas_height: Alto del canvas
             spacing_px: Espaciado en píxeles
         """
+        # Cada familia de líneas es un solo elemento del canvas: una polilínea
+        # que baja por cada línea y vuelve a subir por ella, uniendo las
+        # líneas a lo largo de -1 (fuera de la región visible). Una llamada a
+        # Tcl por familia en lugar de una por línea.
         # Líneas verticales
-        x = spacing_px
-        while x < canvas_width:
-            self.canvas.create_line(
-                x, 0, x, canvas_height,
-                fill=self.GRID_COLOR, width=1, tags="grid"
-            )
-            x += spacing_px
+        xs = np.arange(spacing_px, canvas_width, spacing_px)
+        coords = np.empty((len(xs), 6))
+        coords[:, 0::2] = xs[:, None]
+        coords[:, 1::2] = (-1, canvas_height, -1)
+        self._create_polyline(coords, self.GRID_COLOR, "grid")
 
         # Líneas horizontales
-        y = spacing_px
-        while y < canvas_height:
-            self.canvas.create_line(
-                0, y, canvas_width, y,
-                fill=self.GRID_COLOR, width=1, tags="grid"
-            )
-            y += spacing_px
+        ys = np.arange(spacing_px, canvas_height, spacing_px)
+        coords = np.empty((len(ys), 6))
+        coords[:, 0::2] = (-1, canvas_width, -1)
+        coords[:, 1::2] = ys[:, None]
+        self._create_polyline(coords, self.GRID_COLOR, "grid")
+
+    def _create_polyline(self, coords: np.ndarray, color: str, tag: str):
+        """Crear una polilínea (coords: un tramo de puntos por fila) si hay al menos dos puntos"""
+        if coords.size >= 4:
+            self.canvas.create_line(coords.ravel().tolist(), fill=color, width=1, tags=tag)
+
+    def _mark_positions(self, length: int, spacing_px: float) -> Tuple[list, list]:
+        """
+        Posiciones de las marcas de regla y sus etiquetas en mm
+
+        Cada valor sale de su índice (index * espaciado), sin acumular error
+        de coma flotante; las etiquetas se truncan como int().
+        """
+        positions = np.arange(spacing_px, length, spacing_px)
+        labels = (np.arange(1, len(positions) + 1) * self.ruler_spacing_mm).astype(int)
+        return positions.tolist(), labels.tolist()
 
     def _draw_rulers_simple(self, canvas_width: int, canvas_height: int, spacing_px: float):
         """
@@ -158,10 +228,7 @@ class RulerGridSystem:
             canvas_width: Ancho del canvas
             spacing_px: Espaciado en píxeles
         """
-        x = spacing_px
-        mm = self.ruler_spacing_mm
-
-        while x < canvas_width:
+        for x, mm in zip(*self._mark_positions(canvas_width, spacing_px)):
             # Línea de marca
             self.canvas.create_line(
                 x, 0, x, self.RULER_HEIGHT,
@@ -172,13 +239,10 @@ class RulerGridSystem:
             if x > self.RULER_WIDTH:  # No solapar con regla vertical
                 self.canvas.create_text(
                     x, self.RULER_HEIGHT // 2,
-                    text=f"{int(mm)}", font=("Arial", 8),
+                    text=str(mm), font=("Arial", 8),
                     fill="#666666", tags="ruler"
                 )
 
-            x += spacing_px
-            mm += self.ruler_spacing_mm
-
     def _draw_ruler_marks_vertical(self, canvas_height: int, spacing_px: float):
         """
         Dibujar marcas en la regla vertical
@@ -187,10 +251,7 @@ class RulerGridSystem:
             canvas_height: Alto del canvas
             spacing_px: Espaciado en píxeles
         """
-        y = spacing_px
-        mm = self.ruler_spacing_mm
-
-        while y < canvas_height:
+        for y, mm in zip(*self._mark_positions(canvas_height, spacing_px)):
             # Línea de marca
             self.canvas.create_line(
                 0, y, self.RULER_WIDTH, y,
@@ -201,13 +262,10 @@ class RulerGridSystem:
             if y > self.RULER_HEIGHT:  # No solapar con regla horizontal
                 self.canvas.create_text(
                     self.RULER_WIDTH // 2, y,
-                    text=f"{int(mm)}", font=("Arial", 8),
+                    text=str(mm), font=("Arial", 8),
                     fill="#666666", tags="ruler", angle=90
                 )
 
-            y += spacing_px
-            mm += self.ruler_spacing_mm
-
     def get_ruler_offset(self) -> tuple[int, int]:
         """
         Obtener offset necesario para las reglas
@@ -215,9 +273,7 @@ class RulerGridSystem:
         Returns:
             Tuple con (offset_x, offset_y) en píxeles
         """
-        offset_x = self.RULER_WIDTH if self.show_rulers else 0
-        offset_y = self.RULER_HEIGHT if self.show_rulers else 0
-        return offset_x, offset_y
+        return self._offset_x, self._offset_y
 
     def adjust_canvas_scroll_region(self, total_width: int, total_height: int):
         """
@@ -240,8 +296,7 @@ class RulerGridSystem:
         Returns:
             Coordenadas ajustadas (x, y)
         """
-        offset_x, offset_y = self.get_ruler_offset()
-        return canvas_x - offset_x, canvas_y - offset_y
+        return canvas_x - self._offset_x, canvas_y - self._offset_y
 
     def convert_ruler_to_canvas_coords(self, ruler_x: int, ruler_y: int) -> tuple[int, int]:
         """
@@ -254,8 +309,7 @@ class RulerGridSystem:
         Returns:
             Coordenadas del canvas (x, y)
         """
-        offset_x, offset_y = self.get_ruler_offset()
-        return ruler_x + offset_x, ruler_y + offset_y
+        return ruler_x + self._offset_x, ruler_y + self._offset_y
 
     def is_point_in_ruler_area(self, canvas_x: int, canvas_y: int) -> bool:
         """
@@ -292,7 +346,8 @@ class RulerGridSystem:
             Medidas en mm (x_mm, y_mm)
         """
         # Ajustar por offset de reglas
-        ruler_x, ruler_y = self.convert_canvas_to_ruler_coords(canvas_x, canvas_y)
+        ruler_x = canvas_x - self._offset_x
+        ruler_y = canvas_y - self._offset_y
 
         # Convertir a coordenadas de imagen
         if canvas_scale > 0:
@@ -4,6 +4,7 @@ Extraído de ConfigDesigner usando Strangler Fig Pattern - Fase 3
 """
 import cv2
 import numpy as np
+from collections import OrderedDict
 from typing import Dict, Tuple, Optional, Any
 import logging
 
@@ -18,6 +19,7 @@ class TemplateOverlayManager:
     DEFAULT_OVERLAY_ALPHA = 0.7          # Transparencia del overlay
     MAX_TEMPLATE_RATIO = 0.125           # Máximo 12.5% del tamaño de imagen
     FORCE_300_DPI = True                 # Forzar siempre 300 DPI para logos
+    MAX_CACHED_SIZES = 8                 # Tamaños cacheados por template (LRU)
 
     def __init__(self):
         """Inicializar TemplateOverlayManager"""
@@ -25,6 +27,8 @@ class TemplateOverlayManager:
         self.template_size_mm = None
         self.last_template_id = None
         self.cached_template = None
+        # template_id -> {(width, height): template BGR ya redimensionado}
+        self._resized_cache: Dict[str, "OrderedDict[Tuple[int, int], np.ndarray]"] = {}
 
     def apply_template_overlay(self, base_image: np.ndarray,
                              template_id: str,
@@ -86,23 +90,46 @@ class TemplateOverlayManager:
         Returns:
             Template procesado y escalado
         """
-        # Convertir a formato BGR estándar
-        template_bgr = self._convert_template_to_bgr(template_image)
-
         # Debug: Log valores de calibración
         logger.info(f"Template sizing - ID: {template_id}, mm_per_pixel: {mm_per_pixel}")
 
-        # Calcular tamaño target
+        # Calcular tamaño target (sólo depende de las dimensiones del template)
         target_size = self._calculate_target_template_size(
-            template_bgr, template_id, mm_per_pixel, template_references
+            template_image, template_id, mm_per_pixel, template_references
         )
 
+        # Reutilizar template ya convertido y redimensionado si existe
+        size_cache = self._resized_cache.setdefault(template_id, OrderedDict())
+        cached = size_cache.get(target_size)
+        if cached is not None:
+            size_cache.move_to_end(target_size)
+            return cached
+
+        # Convertir a formato BGR estándar
+        template_bgr = self._convert_template_to_bgr(template_image)
+
         # Redimensionar template
         if target_size != template_bgr.shape[:2][::-1]:  # (width, height)
             template_bgr = cv2.resize(template_bgr, target_size)
 
+        size_cache[target_size] = template_bgr
+        if len(size_cache) > self.MAX_CACHED_SIZES:
+            size_cache.popitem(last=False)
+
         return template_bgr
 
+    def invalidate_template_cache(self, template_id: Optional[str] = None):
+        """
+        Descartar templates redimensionados cacheados
+
+        Args:
+            template_id: ID del template a invalidar (None para todos)
+        """
+        if template_id is None:
+            self._resized_cache.clear()
+        else:
+            self._resized_cache.pop(template_id, None)
+
     def _convert_template_to_bgr(self, template_image: np.ndarray) -> np.ndarray:
         """
         Convertir template a formato BGR
@@ -454,4 +481,5 @@ class TemplateOverlayManager:
         self.template_size = None
         self.template_size_mm = None
         self.last_template_id = None
-        self.cached_template = None
\ No newline at end of file
+        self.cached_template = None
+        self._resized_cache.clear()
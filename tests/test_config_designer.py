@@ -0,0 +1,136 @@
+"""Tests for the configuration designer logo list."""
+from __future__ import annotations
+
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("PIL")
+tk = pytest.importorskip("tkinter")
+
+from alignpress_v2.config.models import Logo, Point, Rectangle
+from alignpress_v2.tools.config_designer import ConfigDesigner
+
+
+class FakeListbox:
+    """Minimal stand-in for tk.Listbox"""
+
+    def __init__(self):
+        self.items = []
+        self.selected = set()
+
+    def insert(self, index, text):
+        if index == tk.END:
+            self.items.append(text)
+        else:
+            self.items.insert(index, text)
+
+    def delete(self, first, last=None):
+        if first == 0 and last == tk.END:
+            self.items.clear()
+        else:
+            del self.items[first]
+
+    def selection_includes(self, index):
+        return index in self.selected
+
+    def selection_set(self, index):
+        self.selected.add(index)
+
+
+def _logo(name, x=0.0):
+    return Logo(
+        id=name, name=name, position_mm=Point(x, 0.0), tolerance_mm=3.0,
+        detector_type="contour", roi=Rectangle(0, 0, 10, 10),
+    )
+
+
+def _designer(logos):
+    return SimpleNamespace(
+        logo_list=FakeListbox(),
+        current_style=SimpleNamespace(logos=logos),
+        _format_logo_list_entry=ConfigDesigner._format_logo_list_entry,
+    )
+
+
+def test_update_logo_list_incremental():
+    designer = _designer([_logo("a"), _logo("b")])
+    update = ConfigDesigner._update_logo_list
+
+    update(designer)
+    assert designer.logo_list.items == ["a (0.0, 0.0mm)", "b (0.0, 0.0mm)"]
+
+    designer.current_style.logos.append(_logo("c"))
+    update(designer, action="add")
+    assert designer.logo_list.items[-1] == "c (0.0, 0.0mm)"
+
+    designer.current_style.logos[1].position_mm.x = 12.5
+    designer.logo_list.selection_set(1)
+    update(designer, 1, action="update")
+    assert designer.logo_list.items[1] == "b (12.5, 0.0mm)"
+    assert designer.logo_list.selection_includes(1)
+
+    designer.current_style.logos.pop(0)
+    update(designer, 0, action="remove")
+    assert designer.logo_list.items == ["b (12.5, 0.0mm)", "c (0.0, 0.0mm)"]
+
+
+class FakeRoot:
+    """Records root.after calls instead of scheduling them"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback, *args):
+        self.scheduled.append((delay, callback, args))
+
+
+def test_poll_template_future_waits_on_tk_thread():
+    registered = []
+    designer = SimpleNamespace(
+        root=FakeRoot(),
+        _register_template=lambda filename, future: registered.append((filename, future)),
+    )
+    designer._poll_template_future = lambda filename, future: ConfigDesigner._poll_template_future(
+        designer, filename, future
+    )
+    future = Future()
+
+    ConfigDesigner._poll_template_future(designer, "logo.png", future)
+    assert registered == []
+    assert len(designer.root.scheduled) == 1
+
+    future.set_result("image")
+    _, callback, args = designer.root.scheduled.pop()
+    callback(*args)
+    assert registered == [("logo.png", future)]
+    assert designer.root.scheduled == []
+
+
+def test_clear_selection_resets_logo_state_together():
+    designer = _designer([_logo("a")])
+    designer.selected_logo_index = 0
+    designer._active_logo = designer.current_style.logos[0]
+    designer.editing_mode = "logo"
+    designer.dragging_logo = True
+
+    ConfigDesigner._clear_selection(designer)
+
+    assert designer.selected_logo_index is None
+    assert designer._active_logo is None
+    assert designer.editing_mode == "none"
+    assert designer.dragging_logo is False
+
+
+def test_clear_selection_keeps_template_mode():
+    designer = _designer([])
+    designer.selected_logo_index = None
+    designer._active_logo = None
+    designer.editing_mode = "template"
+    designer.dragging_logo = False
+
+    ConfigDesigner._clear_selection(designer)
+
+    assert designer.editing_mode == "template"
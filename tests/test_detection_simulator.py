@@ -0,0 +1,210 @@
+"""Tests for the detection simulator."""
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from alignpress_v2.config.models import AlignPressConfig, Logo, Point, Rectangle, Style
+from alignpress_v2.tools.detection_simulator import (
+    ARUCO_PYRAMID_MIN_PIXELS, BATCH_RESULTS_FORMAT_VERSION, DetectionSimulator
+)
+
+
+@pytest.fixture
+def simulator():
+    with DetectionSimulator() as simulator:
+        yield simulator
+
+
+def test_simulator_constructs(simulator):
+    assert simulator.mm_per_pixel == 1.0
+    assert simulator._aruco_dict is not None
+    assert set(simulator._detectors) == {'contour', 'template', 'aruco'}
+
+
+def _session(filename, variant_id, success):
+    return {
+        'image_filename': filename,
+        'variant_id': variant_id,
+        'overall_success': success,
+        'processing_time_ms': 12.5,
+        'average_confidence': 0.9 if success else 0.2,
+        'logo_count': 2,
+        'successful_logos': 2 if success else 0,
+    }
+
+
+def test_export_batch_results_writes_summary_and_jsonl(simulator, tmp_path):
+    all_results = [
+        _session('a.jpg', 'base', True),
+        _session('a.jpg', 'xl', False),
+        _session('b.jpg', 'base', True),
+    ]
+    variant_results = {
+        'base': [all_results[0], all_results[2]],
+        'xl': [all_results[1]],
+    }
+    batch_results = {
+        'all_results': all_results,
+        'variant_results': variant_results,
+        'variants_tested': 2,
+        'batch_stats': simulator._calculate_comprehensive_batch_stats(all_results, variant_results),
+    }
+
+    output_dir = simulator.export_batch_results(
+        batch_results, tmp_path / "out", create_debug_images=False
+    )
+
+    summary = json.loads((output_dir / "batch_results.json").read_text(encoding='utf-8'))
+    assert 'all_results' not in summary
+    assert 'variant_results' not in summary
+    assert summary['variants_tested'] == 2
+    assert summary['format_version'] == BATCH_RESULTS_FORMAT_VERSION
+    assert summary['sessions_file'] == "batch_results.jsonl"
+    assert summary['batch_stats']['total_sessions'] == 3
+    assert summary['batch_stats']['successful_sessions'] == 2
+
+    lines = (output_dir / "batch_results.jsonl").read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line) for line in lines] == all_results
+
+    report = (output_dir / "batch_detection_report.txt").read_text(encoding='utf-8')
+    assert "Total Failed Sessions: 1" in report
+    assert not (output_dir / "debug_images").exists()
+
+
+def _write_image(path, image):
+    assert cv2.imwrite(str(path), image)
+    return str(path)
+
+
+def _checkerboard(size, square):
+    ys, xs = np.indices((size, size))
+    return np.where((xs // square + ys // square) % 2 == 0, 230, 20).astype(np.uint8)
+
+
+def test_get_template_matches_frame_scale_and_rejects_flat(simulator, tmp_path):
+    textured = _write_image(tmp_path / "textured.png", _checkerboard(40, 5))
+    flat = _write_image(tmp_path / "flat.png", np.full((40, 40), 128, np.uint8))
+
+    assert simulator._get_template(textured).shape == (40, 40)
+    assert simulator._get_template(textured, decode_scale=2).shape == (20, 20)
+    assert simulator._get_template(flat) is None
+
+
+def _contour_style(position_mm):
+    logo = Logo(
+        id="chest", name="Pecho", position_mm=position_mm, tolerance_mm=2.0,
+        detector_type="contour", roi=Rectangle(30, 30, 70, 70),
+    )
+    return Style(id="style", name="Style", logos=[logo])
+
+
+def test_error_mm_does_not_depend_on_decode_scale(simulator, tmp_path):
+    simulator.mm_per_pixel = 0.5
+    frame = np.zeros((256, 256, 3), np.uint8)
+    cv2.rectangle(frame, (100, 100), (159, 159), (255, 255, 255), thickness=-1)
+    image_path = tmp_path / "frame.png"
+    _write_image(image_path, frame)
+
+    # Square centre at (130, 130) px = (65, 65) mm; expect it 10 mm to the right
+    style = _contour_style(Point(75.0, 65.0))
+    config = AlignPressConfig()
+
+    errors = [
+        simulator.simulate_garment_detection(
+            image_path, style, config, save_results=False, decode_scale=scale
+        )['logo_results'][0]['error_mm']
+        for scale in (1, 2)
+    ]
+
+    assert errors[0] == pytest.approx(10.0, abs=1.0)
+    assert errors[1] == pytest.approx(errors[0], abs=2 * simulator.mm_per_pixel)
+
+
+def test_read_image_for_target_picks_scale_per_image(tmp_path):
+    large = _write_image(tmp_path / "large.jpg", np.zeros((1600, 1200, 3), np.uint8))
+    small = _write_image(tmp_path / "small.jpg", np.zeros((400, 300, 3), np.uint8))
+
+    frame, scale = DetectionSimulator._read_image_for_target(large, 400)
+    assert scale == 4
+    assert frame.shape[:2] == (400, 300)
+
+    frame, scale = DetectionSimulator._read_image_for_target(small, 400)
+    assert scale == 1
+    assert frame.shape[:2] == (400, 300)
+
+    assert DetectionSimulator._read_image_for_target(tmp_path / "missing.jpg", 400) == (None, 1)
+
+
+def test_aruco_pyramid_corners_are_refined_at_full_resolution(simulator):
+    marker = cv2.aruco.generateImageMarker(simulator._aruco_dict, 7, 241)
+    gray = np.full((900, 900), 255, np.uint8)
+    gray[301:542, 417:658] = marker
+    assert gray.size > ARUCO_PYRAMID_MIN_PIXELS
+    # Marker edges lie between pixel centres
+    expected = np.array([[416.5, 300.5], [657.5, 300.5], [657.5, 541.5], [416.5, 541.5]])
+
+    half_corners, ids, _ = simulator._detect_aruco_markers(cv2.pyrDown(gray))
+    assert ids is not None
+
+    refined = simulator._refine_aruco_corners(gray, half_corners)
+
+    assert np.abs(half_corners[0][0] * 2.0 - expected).max() > 0.5
+    assert np.abs(refined[0][0] - expected).max() < 0.1
+
+
+def test_logo_edits_between_calls_are_not_served_stale(simulator, tmp_path):
+    frame = np.zeros((256, 256, 3), np.uint8)
+    cv2.rectangle(frame, (100, 100), (159, 159), (255, 255, 255), thickness=-1)
+    image_path = tmp_path / "frame.png"
+    _write_image(image_path, frame)
+    style = _contour_style(Point(130.0, 130.0))
+    style.logos[0].roi = Rectangle(60, 60, 140, 140)
+    config = AlignPressConfig()
+
+    def error_mm():
+        result = simulator.simulate_garment_detection(
+            image_path, style, config, save_results=False, adjusted_logos=style.logos
+        )
+        return result['logo_results'][0]['error_mm']
+
+    before = error_mm()
+    style.logos[0].position_mm = Point(150.0, 130.0)
+
+    assert error_mm() == pytest.approx(before + 20.0, abs=1.0)
+
+
+def test_pixel_logo_sets_cover_every_decode_scale(simulator):
+    simulator.mm_per_pixel = 0.5
+    logos = _contour_style(Point(75.0, 65.0)).logos
+
+    assert list(simulator._pixel_logo_sets(logos)) == [1]
+
+    sets = simulator._pixel_logo_sets(logos, target_max_dim=400)
+    assert list(sets) == [1, 2, 4, 8]
+    assert sets[1][0].position_mm.x == pytest.approx(150.0)
+    assert sets[2][0].position_mm.x == pytest.approx(75.0)
+
+
+def test_close_shuts_down_the_logo_pool(tmp_path):
+    image_path = tmp_path / "frame.png"
+    _write_image(image_path, np.zeros((256, 256, 3), np.uint8))
+    style = _contour_style(Point(75.0, 65.0))
+    style.logos.append(_contour_style(Point(20.0, 20.0)).logos[0])
+    config = AlignPressConfig()
+
+    with DetectionSimulator() as simulator:
+        assert simulator._logo_pool is None
+        simulator.simulate_garment_detection(image_path, style, config, save_results=False)
+        pool = simulator._logo_pool
+        assert pool is not None
+    assert simulator._logo_pool is None
+    assert pool._shutdown
+
+    sequential = DetectionSimulator(parallel_logos=False)
+    sequential.simulate_garment_detection(image_path, style, config, save_results=False)
+    assert sequential._logo_pool is None
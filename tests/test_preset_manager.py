@@ -0,0 +1,94 @@
+"""Tests for the preset manager."""
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from alignpress_v2.config.models import Logo, Point, Rectangle, Style
+from alignpress_v2.tools.preset_manager import PresetManager
+
+
+def test_listing_cache_sees_new_files(tmp_path):
+    manager = PresetManager(tmp_path)
+    preset_dir = tmp_path / "design" / "M"
+    preset_dir.mkdir(parents=True)
+    (preset_dir / "front.json").write_text("{}")
+
+    assert manager.get_parts_for_design_size("design", "M") == ["front"]
+
+    (preset_dir / "back.json").write_text("{}")
+
+    assert manager.get_parts_for_design_size("design", "M") == ["back", "front"]
+
+
+def test_invalidate_listing_cache(tmp_path):
+    manager = PresetManager(tmp_path)
+    (tmp_path / "design").mkdir()
+    manager.scan_existing_presets()
+
+    assert manager._listing_cache
+
+    manager.invalidate_listing_cache()
+
+    assert manager._listing_cache == {}
+
+
+def test_load_preset_from_path(tmp_path):
+    manager = PresetManager(tmp_path)
+    config_path = tmp_path / "preset.json"
+    config_path.write_text(json.dumps({'design': 'Camiseta', 'logos': []}), encoding='utf-8')
+
+    assert manager.load_preset_from_path(config_path) == {'design': 'Camiseta', 'logos': []}
+    assert manager.load_preset_from_path(str(config_path))['design'] == 'Camiseta'
+
+
+def test_load_preset_from_path_rejects_invalid_json(tmp_path):
+    manager = PresetManager(tmp_path)
+    config_path = tmp_path / "broken.json"
+    config_path.write_text("{not json", encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        manager.load_preset_from_path(config_path)
+
+
+def test_preset_metadata_from_path(tmp_path):
+    manager = PresetManager(tmp_path)
+    config_path = tmp_path / "Camiseta" / "M" / "delantera.json"
+
+    assert manager.peek_preset_metadata(str(config_path)) == ("Camiseta", "M", "delantera")
+    assert manager.extract_preset_metadata({}, str(config_path)) == ("Camiseta", "M", "delantera")
+
+
+def test_preset_metadata_falls_back_to_config_data(tmp_path):
+    manager = PresetManager(tmp_path / "configs")
+    outside_path = tmp_path / "preset.json"
+    config_data = {'design': 'Gorra', 'size': 'L', 'part': 'frontal'}
+
+    assert manager.peek_preset_metadata(str(outside_path)) is None
+    assert manager.extract_preset_metadata(config_data, str(outside_path)) == ("Gorra", "L", "frontal")
+    assert manager.extract_preset_metadata({}, str(outside_path)) == ("Unknown", "Unknown", "Unknown")
+
+
+def test_saved_preset_shows_up_in_next_listing(tmp_path, monkeypatch):
+    messagebox = pytest.importorskip("tkinter.messagebox")
+    monkeypatch.setattr(messagebox, "showinfo", lambda *args, **kwargs: None)
+    monkeypatch.setattr(messagebox, "askyesno", lambda *args, **kwargs: True)
+    manager = PresetManager(tmp_path)
+    (tmp_path / "Camiseta" / "M").mkdir(parents=True)
+    assert manager.get_parts_for_design_size("Camiseta", "M") == []
+
+    logo = Logo(
+        id="pecho", name="Pecho", position_mm=Point(100.0, 80.0), tolerance_mm=3.0,
+        detector_type="contour", roi=Rectangle(75.0, 55.0, 50.0, 50.0),
+    )
+    style = Style(id="camiseta_m", name="Camiseta M", logos=[logo])
+
+    # Simulate a filesystem whose directory mtime does not move on the write
+    size_dir = tmp_path / "Camiseta" / "M"
+    before = os.stat(size_dir)
+    assert manager.save_preset("Camiseta", "M", "delantera", style, 0.5)
+    os.utime(size_dir, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+    assert manager.get_parts_for_design_size("Camiseta", "M") == ["delantera"]
@@ -0,0 +1,19 @@
+"""Tests for the state manager."""
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from alignpress_v2.controller.state_manager import DetectionResult
+
+
+def test_detection_result_to_dict():
+    result = DetectionResult(
+        logo_id="logo_1", success=True, position=(120.0, 80.5), angle=1.5,
+        confidence=0.93, error_mm=0.4, error_deg=0.2, timestamp=1700000000.0,
+    )
+
+    data = result.to_dict()
+
+    assert data == asdict(result)
+    assert data['position'] == (120.0, 80.5)
+    assert list(data) == list(DetectionResult.__slots__)